@@ -0,0 +1,182 @@
+# ==========================================================
+#        LINK PLAY: input-only lockstep between two consoles
+# ==========================================================
+# Copy this next to main.py. It has no hardware imports: a port is
+# anything with write(buf), any() and read(n) -> bytes or None, so
+# machine.UART works as-is and tools/linktest.py drives it over a socket
+# pair or pty on a PC.
+#
+# Every packet is 5 bytes: type, a, b, c, check.
+#   HELLO  nonce_hi nonce_lo version|ACK    (handshake, higher nonce is P0)
+#   INPUT  frame    bits     prev_bits      (bits for frame and frame-1)
+#   CHECK  n        crc_hi   crc_lo         (state crc at frame n*CHECK_EVERY)
+#
+# Each side sends its input for frame f + DELAY while simulating frame f,
+# so the link has DELAY frames to deliver it before the peer needs it.
+# Frames only advance once both inputs are in, so both consoles run the
+# exact same simulation; periodic CHECK packets catch it if they do not.
+# A side stuck waiting for the peer calls resend(): the peer is then stuck
+# too, within DELAY frames of us, so resending our last 2*DELAY+1 inputs
+# always covers whatever it lost.
+import random
+
+VERSION = 1
+ACK = 0x80
+
+HELLO = 0xA6
+INPUT = 0xA7
+CHECK = 0xA8
+
+DELAY = 3
+CHECK_EVERY = 30
+
+class Link:
+    def __init__(self, port, delay=DELAY, check_every=CHECK_EVERY):
+        self.port = port
+        self.delay = delay
+        self.check_every = check_every
+        self.nonce = random.getrandbits(16)
+        self.peer_nonce = -1
+        self.peer_ready = False   # peer has seen our nonce
+        self.player = -1          # 0 or 1 once connected
+        self.error = None         # "version" or "desync"
+
+        # Inputs by frame & 0xFF. The lockstep window is DELAY frames wide,
+        # far less than 256, so the low byte of the frame is unambiguous.
+        self.local = bytearray(256)
+        self.remote = bytearray(256)
+        self.have = bytearray(256)
+        self.next = 0             # low byte of the next frame to consume
+        self.last = -1            # newest frame we sent input for
+        for f in range(delay):
+            self.have[f] = 1      # nobody moves during the first DELAY frames
+
+        self.crc_tag = [-1] * 8   # local crc by check number
+        self.crc = [0] * 8
+        self.peer_tag = [-1] * 8
+        self.peer_crc = [0] * 8
+
+        self.rx = b""
+        self.pkt = bytearray(5)
+        self.sent = 0             # bytes written, for bandwidth stats
+        self.bad = 0              # packets dropped on a bad check byte
+
+    def send(self, kind, a, b, c):
+        p = self.pkt
+        p[0] = kind
+        p[1] = a
+        p[2] = b
+        p[3] = c
+        p[4] = (kind + a + b + c) & 0xFF ^ 0x5A
+        self.port.write(p)
+        self.sent += 5
+
+    # ---------------- handshake ----------------
+    def hello(self):
+        ack = ACK if self.peer_nonce >= 0 else 0
+        self.send(HELLO, self.nonce >> 8, self.nonce & 0xFF, VERSION | ack)
+
+    def connected(self):
+        if self.player < 0 and self.peer_nonce >= 0 and self.peer_ready:
+            self.player = 0 if self.nonce > self.peer_nonce else 1
+        return self.player >= 0
+
+    # ---------------- lockstep ----------------
+    def send_input(self, frame, bits):
+        # bits for `frame`, which should be the current frame + delay
+        self.local[frame & 0xFF] = bits
+        self.last = frame
+        self.send(INPUT, frame & 0xFF, bits, self.local[(frame - 1) & 0xFF])
+
+    def resend(self):
+        for f in range(max(0, self.last - 2 * self.delay), self.last + 1):
+            self.send(INPUT, f & 0xFF, self.local[f & 0xFF], self.local[(f - 1) & 0xFF])
+
+    def local_input(self, frame):
+        return self.local[frame & 0xFF]
+
+    def remote_input(self, frame):
+        # Peer's bits for `frame`, or -1 if they have not arrived yet
+        i = frame & 0xFF
+        if not self.have[i]:
+            return -1
+        return self.remote[i]
+
+    def consume(self, frame):
+        # Done with `frame`; its slot gets reused 256 frames later
+        self.have[frame & 0xFF] = 0
+        self.next = (frame + 1) & 0xFF
+
+    def pending(self, seq):
+        # True if frame byte `seq` is not consumed yet (ahead of self.next)
+        return (seq - self.next) & 0xFF < 0x80
+
+    def check(self, frame, crc):
+        # Call with the state crc after simulating every check_every-th frame
+        n = (frame // self.check_every) & 0xFF
+        slot = n & 7
+        self.crc_tag[slot] = n
+        self.crc[slot] = crc & 0xFFFF
+        self.send(CHECK, n, (crc >> 8) & 0xFF, crc & 0xFF)
+        self.compare(slot)
+
+    def compare(self, slot):
+        if self.crc_tag[slot] >= 0 and self.crc_tag[slot] == self.peer_tag[slot]:
+            if self.crc[slot] != self.peer_crc[slot]:
+                self.error = "desync"
+
+    # ---------------- receive ----------------
+    def poll(self):
+        if not self.port.any():
+            return
+        data = self.port.read(64)
+        if not data:
+            return
+        buf = self.rx + data
+        i = 0
+        while len(buf) - i >= 5:
+            kind = buf[i]
+            if kind < HELLO or kind > CHECK:
+                i += 1
+                continue
+            a = buf[i + 1]
+            b = buf[i + 2]
+            c = buf[i + 3]
+            if (kind + a + b + c) & 0xFF ^ 0x5A != buf[i + 4]:
+                # corrupt or misaligned: slide one byte and resync
+                self.bad += 1
+                i += 1
+                continue
+            self.handle(kind, a, b, c)
+            i += 5
+        self.rx = buf[i:]
+
+    def handle(self, kind, a, b, c):
+        if kind == INPUT:
+            self.peer_ready = True
+            if self.pending(a):
+                self.remote[a] = b
+                self.have[a] = 1
+            # every packet repeats the previous frame's bits, which covers
+            # a packet lost to line noise
+            prev = (a - 1) & 0xFF
+            if not self.have[prev] and self.pending(prev):
+                self.remote[prev] = c
+                self.have[prev] = 1
+        elif kind == HELLO:
+            if c & 0x7F != VERSION:
+                self.error = "version"
+                return
+            peer = (a << 8) | b
+            if peer == self.nonce:
+                # both picked the same nonce: pick again, peer will too
+                self.nonce = random.getrandbits(16)
+                return
+            self.peer_nonce = peer
+            if c & ACK:
+                self.peer_ready = True
+        elif kind == CHECK:
+            slot = a & 7
+            self.peer_tag[slot] = a
+            self.peer_crc[slot] = (b << 8) | c
+            self.compare(slot)
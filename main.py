@@ -1,8 +1,16 @@
 import time
+BOOT_T0 = time.ticks_ms()
 import random
 import gc
+import os
+import sys
+import select
+import struct
+import binascii
 import framebuf
-from machine import Pin, SPI, ADC, PWM
+import micropython
+from array import array
+from machine import Pin, SPI, ADC, PWM, UART
 
 # ==========================================================
 #                      CONFIGURATION
@@ -10,6 +18,39 @@ from machine import Pin, SPI, ADC, PWM
 WIDTH = 240
 HEIGHT = 320
 BAUDRATE = 62_500_000 
+STREAM = True  # let a host start framebuffer streaming over USB serial
+SAVE_TO_FLASH = False  # keep suspended games across power cycles
+
+# Link cable for two-console Pong: cross TX/RX and share GND
+LINK_UART = 1
+LINK_TX = 4
+LINK_RX = 5
+LINK_BAUD = 115200
+LINK_FRAME_MS = 33
+LINK_TIMEOUT_MS = 3000
+
+# Quality governor: per-frame work (everything but the game's own sleep)
+# above this makes it shed visual quality so game speed holds
+GOV_TARGET_MS = 35
+
+# Attract mode: after this long idle in the menu the games play themselves,
+# each for ATTRACT_GAME_MS, until any control is touched
+ATTRACT_IDLE_MS = 30000
+ATTRACT_GAME_MS = 40000
+
+# Difficulty, read when a game starts. "speed" is the starting frame delay
+# in seconds (Dino: scroll speed in px per frame), "ramp" what the delay is
+# multiplied by at each difficulty step, "spawn" frames between new pipes,
+# blocks or obstacles. tools/batch.py sweeps these on a PC.
+TUNING = {
+    "Snake":  {"speed": 0.16, "step": 0.005, "min_speed": 0.055},
+    "Pong":   {"speed": 0.03, "ramp": 0.95, "ball": 3},
+    "Space":  {"speed": 0.055, "ramp": 0.93, "fall": 5},
+    "Flappy": {"speed": 0.03, "ramp": 0.96, "gap": 95, "min_gap": 56, "spawn": 60},
+    "Dodger": {"speed": 0.04, "ramp": 0.96, "blocks": 4, "spawn": 60},
+    "Cave":   {"speed": 0.035, "ramp": 0.97, "gap": 190, "min_gap": 90},
+    "Dino":   {"speed": 6, "spawn": 80, "min_spawn": 25},
+}
 
 joy_x = ADC(26)
 joy_y = ADC(27)
@@ -37,6 +78,46 @@ except:
 # ==========================================================
 #                      DISPLAY DRIVER
 # ==========================================================
+@micropython.viper
+def double_row(dst, src, off: int, n: int):
+    # n RGB565 pixels from src (starting at pixel off) into dst as two
+    # lines of 2n pixels each: every pixel and the line itself doubled
+    d = ptr16(dst)
+    s = ptr16(src)
+    n2 = n * 2
+    i = 0
+    while i < n:
+        v = s[off + i]
+        d[i * 2] = v
+        d[i * 2 + 1] = v
+        d[n2 + i * 2] = v
+        d[n2 + i * 2 + 1] = v
+        i += 1
+
+@micropython.viper
+def rle_row(out, src, i: int, end: int) -> int:
+    # Run-length encode RGB565 bytes src[i:end] into out[3:] as runs of
+    # (count, hi, lo), store the run count in out[2], return the length.
+    # Rows are at most 240 pixels, so a count always fits in a byte.
+    o = ptr8(out)
+    s = ptr8(src)
+    k = 3
+    runs = 0
+    while i < end:
+        hi = s[i]
+        lo = s[i + 1]
+        j = i + 2
+        while j < end and s[j] == hi and s[j + 1] == lo:
+            j += 2
+        o[k] = (j - i) >> 1
+        o[k + 1] = hi
+        o[k + 2] = lo
+        k += 3
+        runs += 1
+        i = j
+    o[2] = runs
+    return k
+
 class ST7789_FB:
     def __init__(self, spi, width, height, reset, dc, cs):
         self.width = width
@@ -46,13 +127,53 @@ class ST7789_FB:
         self.dc = dc
         self.cs = cs
         self.cs.value(1)
-
-        self.init_display()
+        self.hooks = []  # called after every refresh (profiler etc.)
+        self.buffer = None
+        self.fb = None
+        self.scale = 1   # 2: half-resolution framebuffer, doubled on refresh
+        self.fb_w = width
+        self.fb_h = height
+        self.scanline = bytearray(width * 2 * 2)  # two panel lines
+        self.stream_on = False
+        self.row_crc = None
+
+        # Only the reset pulse here: the rest of boot runs while the panel
+        # comes out of reset, then init_finish() and alloc() complete it.
+        self.init_start()
+
+    def alloc(self, scale=1):
+        # Full framebuffer, or a quarter-size one at scale 2
         gc.collect()
-
-        # Full framebuffer
-        self.buffer = bytearray(self.width * self.height * 2)
-        self.fb = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.RGB565)
+        self.scale = scale
+        self.fb_w = self.width // scale
+        self.fb_h = self.height // scale
+        self.buffer = bytearray(self.fb_w * self.fb_h * 2)
+        self.fb = framebuf.FrameBuffer(self.buffer, self.fb_w, self.fb_h, framebuf.RGB565)
+
+        if STREAM:
+            if self.row_crc is None:
+                self.stream_init()
+            else:
+                self.row_crc = [-1] * self.height  # new size: resend all
+
+    def set_scale(self, scale):
+        # Swap framebuffers, releasing the old one first: the heap has room
+        # for one full framebuffer, never for both. Going down always fits
+        # where the old one was. Going back up can fail on a fragmented
+        # heap, and then the small one is rebuilt, which also fits where
+        # it was, and the old scale kept (returns False). Callers must
+        # drop their own references to self.fb first.
+        if scale == self.scale:
+            return True
+        old = self.scale
+        self.buffer = None
+        self.fb = None
+        try:
+            self.alloc(scale)
+        except MemoryError:
+            self.alloc(old)
+            return False
+        return True
 
     def write_cmd(self, cmd):
         self.dc.value(0)
@@ -66,13 +187,22 @@ class ST7789_FB:
         self.spi.write(buf)
         self.cs.value(1)
 
-    def init_display(self):
-        self.rst.value(1); time.sleep(0.1)
-        self.rst.value(0); time.sleep(0.1)
-        self.rst.value(1); time.sleep(0.1)
-
-        self.write_cmd(0x01); time.sleep(0.150)
-        self.write_cmd(0x11); time.sleep(0.150)
+    def init_start(self):
+        # Datasheet minimums: RESX low >= 10 us. SLPOUT may follow 5 ms
+        # after reset from sleep-in, but 120 ms if the panel was already
+        # awake (soft reboot), so allow 120 ms. A hardware reset makes the
+        # old SWRESET + 150 ms redundant.
+        self.rst.value(1)
+        self.rst.value(0)
+        time.sleep_us(20)
+        self.rst.value(1)
+        self.ready_at = time.ticks_add(time.ticks_ms(), 120)
+
+    def init_finish(self):
+        wait = time.ticks_diff(self.ready_at, time.ticks_ms())
+        if wait > 0:
+            time.sleep_ms(wait)
+        self.write_cmd(0x11); time.sleep_ms(5)  # SLPOUT
 
         self.write_cmd(0x3A)
         self.write_data(bytearray([0x55]))  # 16-bit color
@@ -83,26 +213,155 @@ class ST7789_FB:
 
         self.write_cmd(0x21)  # inversion
         self.write_cmd(0x13)
+
+    def on(self):
         self.write_cmd(0x29)
 
-    def refresh(self):
+    def set_window(self, x0, y0, x1, y1):
         self.write_cmd(0x2A)
-        self.write_data(bytearray([0,0,(self.width-1)>>8,(self.width-1)&0xFF]))
+        self.write_data(bytearray([x0>>8,x0&0xFF,x1>>8,x1&0xFF]))
         self.write_cmd(0x2B)
-        self.write_data(bytearray([0,0,(self.height-1)>>8,(self.height-1)&0xFF]))
+        self.write_data(bytearray([y0>>8,y0&0xFF,y1>>8,y1&0xFF]))
         self.write_cmd(0x2C)
 
+    def blit(self, buf, x, y, w, h, repeat=1):
+        # Write a w x h RGB565 buffer straight to the panel, `repeat` times
+        # stacked vertically. Works before the framebuffer exists.
+        self.set_window(x, y, x + w - 1, y + h * repeat - 1)
         self.dc.value(1)
         self.cs.value(0)
-        self.spi.write(self.buffer)
+        for _ in range(repeat):
+            self.spi.write(buf)
         self.cs.value(1)
 
+    def refresh(self, y0=0, y1=-1, present=True):
+        # Send framebuffer rows y0..y1-1 (default: all of them). With
+        # present=False nothing goes to the panel, but the frame still
+        # counts: the stream and the per-frame hooks run as usual.
+        if y1 < 0:
+            y1 = self.fb_h
+        if present and y1 > y0:
+            s = self.scale
+            self.set_window(0, y0 * s, self.width - 1, y1 * s - 1)
+
+            self.dc.value(1)
+            self.cs.value(0)
+            if s == 1:
+                if y0 == 0 and y1 == self.fb_h:
+                    self.spi.write(self.buffer)
+                else:
+                    stride = self.fb_w * 2
+                    self.spi.write(memoryview(self.buffer)[y0 * stride:y1 * stride])
+            else:
+                line = self.scanline
+                w = self.fb_w
+                for y in range(y0, y1):
+                    double_row(line, self.buffer, y * w, w)
+                    self.spi.write(line)
+            self.cs.value(1)
+
+        if STREAM:
+            self.stream_poll()
+            if self.stream_on:
+                self.stream_frame()
+
+        for hook in self.hooks:
+            hook()
+
+    # ------------------------------------------------------
+    # Framebuffer streaming over USB CDC (see tools/fbstream.py)
+    #
+    # Host -> console:  'S' <interval ms, ASCII digits> '\n'  start,  'X' stop,
+    #                   'K' resend everything,  0x06 ack one frame
+    # Console -> host:  A5 5A 'F' seq:u16 w:u16 h:u16 nrows:u16
+    #                   then per changed row: y:u16 nruns:u8
+    #                   and nruns x (count:u8, rgb565 big-endian:u16)
+    # ------------------------------------------------------
+    def stream_init(self):
+        self.stream_ms = 100
+        self.stream_window = 3  # unacked frames before we stop sending
+        self.stream_pending = 0
+        self.stream_seq = 0
+        self.stream_last = time.ticks_ms()
+        self.stream_out = sys.stdout.buffer
+        self.stream_in = select.poll()
+        self.stream_in.register(sys.stdin, select.POLLIN)
+        self.row_crc = [-1] * self.height
+        self.row_dirty = bytearray(self.height)
+        self.row_out = bytearray(3 + self.width * 3)
+        self.row_mv = memoryview(self.row_out)
+        self.stream_hdr = bytearray(11)
+
+    def stream_poll(self):
+        while self.stream_in.poll(0):
+            c = sys.stdin.buffer.read(1)
+            if c == b"\x06":
+                if self.stream_pending > 0:
+                    self.stream_pending -= 1
+            elif c == b"S":
+                # Digits, not a raw byte: USB CDC turns a 0x03 byte into
+                # Ctrl-C, which would stop main.py
+                ms = 0
+                for _ in range(6):
+                    d = sys.stdin.buffer.read(1)
+                    if not d or d == b"\n":
+                        break
+                    if b"0" <= d <= b"9":
+                        ms = ms * 10 + d[0] - 48
+                self.stream_ms = max(10, ms)
+                self.stream_pending = 0
+                self.row_crc = [-1] * self.height
+                self.stream_on = True
+            elif c == b"K":
+                self.row_crc = [-1] * self.height
+            elif c == b"X":
+                self.stream_on = False
+
+    def stream_frame(self):
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.stream_last) < self.stream_ms:
+            return
+        # Host is not keeping up: skip this frame. Row hashes are left alone,
+        # so whatever changes meanwhile goes out with the next sent frame.
+        if self.stream_pending >= self.stream_window:
+            return
+        self.stream_last = now
+
+        stride = self.fb_w * 2
+        mv = memoryview(self.buffer)
+        nrows = 0
+        for y in range(self.fb_h):
+            crc = binascii.crc32(mv[y * stride:(y + 1) * stride])
+            if crc != self.row_crc[y]:
+                self.row_crc[y] = crc
+                self.row_dirty[y] = 1
+                nrows += 1
+            else:
+                self.row_dirty[y] = 0
+
+        self.stream_seq = (self.stream_seq + 1) & 0xFFFF
+        struct.pack_into(">3sHHHH", self.stream_hdr, 0, b"\xa5\x5aF",
+                         self.stream_seq, self.fb_w, self.fb_h, nrows)
+        self.stream_out.write(self.stream_hdr)
+        for y in range(self.fb_h):
+            if self.row_dirty[y]:
+                self.stream_out.write(self.row_mv[:self.stream_row(y)])
+        self.stream_pending += 1
+
+    def stream_row(self, y):
+        # Encode one row into row_out, return its length
+        out = self.row_out
+        out[0] = y >> 8
+        out[1] = y & 0xFF
+        i = y * self.fb_w * 2
+        return rle_row(out, self.buffer, i, i + self.fb_w * 2)
+
 # ==========================================================
 #                   GLOBALS / COLORS
 # ==========================================================
 spi = SPI(0, baudrate=BAUDRATE, polarity=1, phase=1, sck=sck, mosi=mosi)
 display = ST7789_FB(spi, WIDTH, HEIGHT, rst, dc, cs)
-fb = display.fb
+fb = None  # set by boot() once the framebuffer exists
 
 BLACK   = 0x0000
 WHITE   = 0xFFFF
@@ -116,6 +375,296 @@ MAGENTA = 0xF81F
 BAR_TOP = BLUE
 BAR_SEL = YELLOW
 
+# ==========================================================
+#                   DRAWING
+# ==========================================================
+# Games draw through these instead of fb directly. Shapes that are fully
+# offscreen are skipped, and instead of filling the whole screen black
+# every frame, frame_begin() only clears what was drawn the frame before.
+# Coordinates are always in 240x320 screen space; on a half-resolution
+# framebuffer (SHIFT = 1) they are halved here, so games opt in without
+# touching their own numbers.
+SHIFT = 0
+FB_W = WIDTH
+FB_H = HEIGHT
+
+MAX_DIRTY = 64
+dirty = array('h', [0] * (MAX_DIRTY * 4))  # x, y, w, h per drawn shape
+n_dirty = 0       # -1: list overflowed, clear the whole screen next frame
+px_written = 0    # pixels written this frame, clears included
+px_last = 0       # same, for the last presented frame
+span_y0 = 0       # framebuffer rows touched since the last refresh
+span_y1 = 0
+
+# HUD bands (title bar, score line). The governor can freeze them: then
+# nothing is drawn or cleared outside CLIP_Y0..CLIP_Y1.
+HUD_TOP = 30
+HUD_BOTTOM = 296
+hud_frozen = False
+CLIP_Y0 = 0
+CLIP_Y1 = HEIGHT
+
+def area(x, y, w, h):
+    # Pixels of (x, y, w, h) that land in the framebuffer
+    x1 = min(x + w, FB_W)
+    y1 = min(y + h, FB_H)
+    x = max(x, 0)
+    y = max(y, 0)
+    if x1 <= x or y1 <= y:
+        return 0
+    return (x1 - x) * (y1 - y)
+
+def mark(x, y, w, h):
+    global n_dirty
+    if n_dirty < 0:
+        return
+    if n_dirty == MAX_DIRTY:
+        n_dirty = -1
+        return
+    i = n_dirty * 4
+    dirty[i] = x
+    dirty[i + 1] = y
+    dirty[i + 2] = w
+    dirty[i + 3] = h
+    n_dirty += 1
+    touch(y, y + h)
+
+def touch(y0, y1):
+    global span_y0, span_y1
+    if y0 < span_y0:
+        span_y0 = y0
+    if y1 > span_y1:
+        span_y1 = y1
+
+def frame_reset():
+    # Start from a black screen with nothing to clear (game start/exit)
+    global n_dirty, hud_frozen, CLIP_Y0, CLIP_Y1
+    fb.fill(BLACK)
+    n_dirty = 0
+    hud_frozen = False
+    CLIP_Y0 = 0
+    CLIP_Y1 = FB_H
+    touch(0, FB_H)
+
+def frame_begin():
+    global n_dirty, px_written, hud_frozen, CLIP_Y0, CLIP_Y1
+    px_written = 0
+    was_frozen = hud_frozen
+    # frozen HUD still gets redrawn every 30th frame so the score moves
+    hud_frozen = gov.tier >= 2 and gov.frames % 30 != 0
+    if hud_frozen:
+        CLIP_Y0 = HUD_TOP >> SHIFT
+        CLIP_Y1 = HUD_BOTTOM >> SHIFT
+    else:
+        CLIP_Y0 = 0
+        CLIP_Y1 = FB_H
+        if was_frozen:
+            # the bands hold shapes that were never recorded for clearing
+            fb.fill_rect(0, 0, FB_W, HUD_TOP >> SHIFT, BLACK)
+            fb.fill_rect(0, HUD_BOTTOM >> SHIFT, FB_W, FB_H, BLACK)
+            px_written += FB_W * (FB_H - ((HUD_BOTTOM - HUD_TOP) >> SHIFT))
+            touch(0, FB_H)
+
+    if n_dirty < 0:
+        fb.fill_rect(0, CLIP_Y0, FB_W, CLIP_Y1 - CLIP_Y0, BLACK)
+        px_written += FB_W * (CLIP_Y1 - CLIP_Y0)
+        touch(CLIP_Y0, CLIP_Y1)
+    else:
+        for i in range(0, n_dirty * 4, 4):
+            x = dirty[i]
+            y = dirty[i + 1]
+            w = dirty[i + 2]
+            h = dirty[i + 3]
+            if y < CLIP_Y0:
+                h -= CLIP_Y0 - y
+                y = CLIP_Y0
+            if y + h > CLIP_Y1:
+                h = CLIP_Y1 - y
+            if h <= 0:
+                continue
+            fb.fill_rect(x, y, w, h, BLACK)
+            px_written += area(x, y, w, h)
+            touch(y, y + h)
+    n_dirty = 0
+
+def set_render_scale(scale):
+    # 1: draw at 240x320. 2: draw at 120x160 (38 KB instead of 150 KB)
+    # and let refresh() double it. Stays put if the buffer will not fit.
+    global fb, SHIFT, FB_W, FB_H
+    fb = None  # so the old framebuffer is only held by the driver
+    if not display.set_scale(scale):
+        print("[draw] no room for scale %d, staying at %d" % (scale, display.scale))
+    fb = display.fb
+    SHIFT = 1 if display.scale == 2 else 0
+    FB_W = display.fb_w
+    FB_H = display.fb_h
+    frame_reset()
+
+def frame_end():
+    global px_last, span_y0, span_y1
+    px_last = px_written
+    tier = gov.frame()
+    if tier >= 4 and gov.frames & 1:
+        # Logic keeps running, the panel gets every other frame. The
+        # changed rows carry over to the next one.
+        display.refresh(present=False)
+        return
+    if tier >= 3:
+        display.refresh(max(0, span_y0), min(FB_H, span_y1))
+    else:
+        display.refresh()
+    span_y0 = FB_H
+    span_y1 = 0
+
+def draw_rect(x, y, w, h, c):
+    global px_written
+    if x >= WIDTH or y >= HEIGHT or x + w <= 0 or y + h <= 0:
+        return
+    if SHIFT:
+        w = ((x + w) >> 1) - (x >> 1)
+        h = ((y + h) >> 1) - (y >> 1)
+        x >>= 1
+        y >>= 1
+    if y < CLIP_Y0:
+        h -= CLIP_Y0 - y
+        y = CLIP_Y0
+    if y + h > CLIP_Y1:
+        h = CLIP_Y1 - y
+    if h <= 0:
+        return
+    fb.fill_rect(x, y, w, h, c)
+    px_written += area(x, y, w, h)
+    mark(x, y, w, h)
+
+def draw_ring(x, y, w, h, c, t=1):
+    # Outline only, t pixels thick
+    global px_written
+    if x >= WIDTH or y >= HEIGHT or x + w <= 0 or y + h <= 0 or gov.tier >= 1:
+        return
+    if SHIFT:
+        w = ((x + w) >> 1) - (x >> 1)
+        h = ((y + h) >> 1) - (y >> 1)
+        x >>= 1
+        y >>= 1
+        t = (t + 1) >> 1
+    fb.fill_rect(x, y, w, t, c)
+    fb.fill_rect(x, y + h - t, w, t, c)
+    fb.fill_rect(x, y + t, t, h - t - t, c)
+    fb.fill_rect(x + w - t, y + t, t, h - t - t, c)
+    px_written += area(x, y, w, h) - area(x + t, y + t, w - t - t, h - t - t)
+    mark(x, y, w, h)
+
+def draw_box(x, y, w, h, c, border, t=1):
+    # Filled box with a border: every pixel written once, unlike a
+    # border-coloured rect with a smaller one painted on top
+    global px_written
+    if gov.tier >= 1:
+        draw_rect(x, y, w, h, c)  # outline dropped by the governor
+        return
+    if x >= WIDTH or y >= HEIGHT or x + w <= 0 or y + h <= 0:
+        return
+    if SHIFT:
+        w = ((x + w) >> 1) - (x >> 1)
+        h = ((y + h) >> 1) - (y >> 1)
+        x >>= 1
+        y >>= 1
+        t = (t + 1) >> 1
+    fb.fill_rect(x, y, w, t, border)
+    fb.fill_rect(x, y + h - t, w, t, border)
+    fb.fill_rect(x, y + t, t, h - t - t, border)
+    fb.fill_rect(x + w - t, y + t, t, h - t - t, border)
+    fb.fill_rect(x + t, y + t, w - t - t, h - t - t, c)
+    px_written += area(x, y, w, h)
+    mark(x, y, w, h)
+
+def draw_text(text, x, y, c):
+    # The 8x8 font is not scaled: at half resolution text comes out 16x16
+    global px_written
+    w = len(text) * 8
+    if x >= WIDTH or y >= HEIGHT or x + (w << SHIFT) <= 0 or y + (8 << SHIFT) <= 0:
+        return
+    x >>= SHIFT
+    y >>= SHIFT
+    if y < CLIP_Y0 or y + 8 > CLIP_Y1:
+        return
+    fb.text(text, x, y, c)
+    px_written += area(x, y, w, 8)
+    mark(x, y, w, 8)
+
+# ==========================================================
+#                   QUALITY GOVERNOR
+# ==========================================================
+# Watches how long each frame's work takes (frame period minus the game's
+# own frame_sleep) and trades looks for speed when it runs over budget, so
+# a busy screen does not make the game slower instead of harder.
+# Each tier includes the ones before it:
+#   1  sprite outlines dropped (draw_box fills plain, draw_ring skipped)
+#   2  HUD bands frozen, redrawn only every 30th frame
+#   3  only the rows that changed are sent to the panel
+#   4  every other frame is not sent to the panel at all
+GOV_TIERS = 5
+
+class Governor:
+    def __init__(self, target_ms):
+        self.target = target_ms * 1000
+        self.start()
+        self.active = False
+
+    def start(self):
+        self.active = True
+        self.tier = 0
+        self.frames = 0
+        self.busy = 0      # smoothed work per frame, us
+        self.over = 0
+        self.under = 0
+        self.slept = 0
+        self.t_last = time.ticks_us()
+
+    def stop(self):
+        self.active = False
+        self.tier = 0
+
+    def sleep(self, seconds):
+        t0 = time.ticks_us()
+        time.sleep(seconds)
+        self.slept += time.ticks_diff(time.ticks_us(), t0)
+
+    def frame(self):
+        # Called once per frame from frame_end(); returns the tier to use
+        self.frames += 1
+        if not self.active:
+            return 0
+        now = time.ticks_us()
+        busy = time.ticks_diff(now, self.t_last) - self.slept
+        self.t_last = now
+        self.slept = 0
+        self.busy += (busy - self.busy) >> 3
+
+        if self.busy > self.target:
+            self.under = 0
+            self.over += 1
+            if self.over >= 8 and self.tier < GOV_TIERS - 1:
+                self.tier += 1
+                self.over = 0
+        elif self.busy < self.target * 6 // 10:
+            # well under budget for two seconds or so: try one tier better
+            self.over = 0
+            self.under += 1
+            if self.under >= 60 and self.tier > 0:
+                self.tier -= 1
+                self.under = 0
+        else:
+            self.over = 0
+            self.under = 0
+        return self.tier
+
+gov = Governor(GOV_TARGET_MS)
+
+def frame_sleep(seconds):
+    # Games pace themselves with this instead of time.sleep() so the
+    # governor can tell their deliberate delay from real work
+    gov.sleep(seconds)
+
 # ==========================================================
 #                   SUPPORT FUNCTIONS
 # ==========================================================
@@ -126,10 +675,18 @@ def beep(freq, duration_ms):
     buzzer.duty_u16(0)
 
 def center_text(text, y, color):
-    x = (WIDTH - len(text)*8)//2
-    fb.text(text, x, y, color)
+    x = (WIDTH - (len(text)*8 << SHIFT))//2
+    draw_text(text, x, y, color)
+
+hud_score = 0  # last score a game showed, for tools/batch.py
+
+def draw_score(score):
+    global hud_score
+    hud_score = score
+    center_text("SCORE %d" % score, 300, WHITE)
 
 def clean():
+    frame_reset()
     gc.collect()
     time.sleep_ms(2)
 
@@ -144,7 +701,44 @@ def debounce_button(pin):
         else:
             break
 
+# Games read the controls only through get_direction(), btn_a() and
+# btn_b(). With autoplay on, each game calls its ai_*() player once per
+# frame, and these return what the AI chose instead of the hardware.
+autoplay = False
+autoplay_end = None    # ticks_ms() when the AI hands back, None = never
+autoplay_quit = False  # a human touched a control during autoplay
+ai_dir = None
+ai_b = False
+
+def steer(direction, b=False):
+    global ai_dir, ai_b
+    ai_dir = direction
+    ai_b = b
+
+def human_input():
+    return not BTN_A.value() or not BTN_B.value() or read_joystick() is not None
+
+def btn_a():
+    # During autoplay A means "hand back": any real control, or time is up
+    global autoplay_quit
+    if autoplay:
+        if human_input():
+            autoplay_quit = True
+            return True
+        return autoplay_end is not None and time.ticks_diff(time.ticks_ms(), autoplay_end) >= 0
+    return not BTN_A.value()
+
+def btn_b():
+    if autoplay:
+        return ai_b
+    return not BTN_B.value()
+
 def get_direction():
+    if autoplay:
+        return ai_dir
+    return read_joystick()
+
+def read_joystick():
     x = joy_x.read_u16()
     y = joy_y.read_u16()
     low = 20000
@@ -161,8 +755,8 @@ def get_direction():
     return None
 
 def show_game_over(title, score):
-    fb.fill(BLACK)
-    fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+    frame_reset()
+    draw_rect(0, 0, WIDTH, 30, BAR_TOP)
     center_text(title.upper(), 10, BLACK)
     center_text("GAME OVER", 130, RED)
     center_text("SCORE %d" % score, 160, WHITE)
@@ -180,6 +774,405 @@ def show_game_over(title, score):
             break
         time.sleep_ms(20)
 
+# ==========================================================
+#                   MEMORY TELEMETRY
+# ==========================================================
+def largest_free_block(limit=None):
+    # No API for this on MicroPython: binary search with real allocations.
+    # Costs one gc.collect() per probe, so only use it outside game loops.
+    gc.collect()
+    if limit is None:
+        limit = gc.mem_free()
+    lo = 0
+    hi = limit
+    while hi - lo > 64:
+        mid = (lo + hi) // 2
+        try:
+            probe = bytearray(mid)
+            probe = None
+            lo = mid
+        except MemoryError:
+            hi = mid
+        gc.collect()
+    return lo
+
+def block_fits(size):
+    gc.collect()
+    try:
+        probe = bytearray(size)
+        probe = None
+        return True
+    except MemoryError:
+        return False
+    finally:
+        gc.collect()
+
+class Profiler:
+    def __init__(self):
+        self.name = None
+
+    def start(self, name):
+        gc.collect()
+        self.name = name
+        self.frames = 0
+        self.free_min = gc.mem_free()
+        self.alloc_peak = gc.mem_alloc()
+        self.last_alloc = self.alloc_peak
+        self.churn_peak = 0   # bytes allocated within a single frame
+        self.churn_total = 0
+        self.gcs = 0          # collections seen between two frames
+        self.px_peak = 0      # pixels written per frame
+        self.px_total = 0
+        self.resumed = False
+        self.suspend_us = -1
+        self.first_us = -1    # game entry to first presented frame
+        self.t_enter = time.ticks_us()
+        self.tier_frames = [0] * GOV_TIERS
+        self.busy_peak = 0
+        self.ai_turns = 0
+        self.ai_total = 0     # us spent in the AI player, not in the game
+        self.ai_peak = 0
+        self.block_start = largest_free_block()
+
+    def frame(self):
+        if self.name is None:
+            return
+        free = gc.mem_free()
+        alloc = gc.mem_alloc()
+        self.frames += 1
+        if self.frames == 1:
+            self.first_us = time.ticks_diff(time.ticks_us(), self.t_enter)
+        self.px_total += px_last
+        self.tier_frames[gov.tier] += 1
+        if gov.busy > self.busy_peak:
+            self.busy_peak = gov.busy
+        if px_last > self.px_peak:
+            self.px_peak = px_last
+        if free < self.free_min:
+            self.free_min = free
+        if alloc > self.alloc_peak:
+            self.alloc_peak = alloc
+        churn = alloc - self.last_alloc
+        if churn < 0:
+            # heap shrank: a collection ran, churn for this frame is unknown
+            self.gcs += 1
+        else:
+            self.churn_total += churn
+            if churn > self.churn_peak:
+                self.churn_peak = churn
+        self.last_alloc = alloc
+
+    def ai(self, us):
+        if self.name is None:
+            return
+        self.ai_turns += 1
+        self.ai_total += us
+        if us > self.ai_peak:
+            self.ai_peak = us
+
+    def stop(self):
+        if self.name is None:
+            return
+        block_end = largest_free_block()
+        frames = max(1, self.frames)
+        print("[mem] %s frames=%d free_min=%d alloc_peak=%d churn_peak=%d churn_avg=%d gcs=%d block=%d->%d" % (
+            self.name, self.frames, self.free_min, self.alloc_peak,
+            self.churn_peak, self.churn_total // frames, self.gcs,
+            self.block_start, block_end))
+        print("[draw] %s px_avg=%d px_peak=%d (framebuffer=%d)" % (
+            self.name, self.px_total // frames, self.px_peak, FB_W * FB_H))
+        print("[gov] %s frames_per_tier=%s busy_peak_us=%d target_us=%d" % (
+            self.name, self.tier_frames, self.busy_peak, gov.target))
+        print("[save] %s resumed=%d first_frame_us=%d suspend_us=%d" % (
+            self.name, self.resumed, self.first_us, self.suspend_us))
+        if self.ai_turns:
+            print("[ai] %s turns=%d us_avg=%d us_peak=%d" % (
+                self.name, self.ai_turns, self.ai_total // self.ai_turns, self.ai_peak))
+        self.name = None
+
+prof = Profiler()
+display.hooks.append(prof.frame)
+
+def show_low_memory(title, free, block):
+    frame_reset()
+    draw_rect(0, 0, WIDTH, 30, BAR_TOP)
+    center_text(title.upper(), 10, BLACK)
+    center_text("LOW MEMORY", 130, RED)
+    center_text("FREE %d" % free, 160, WHITE)
+    # 15 characters to a line at half resolution
+    center_text("NEED %d" % block[0], 180, WHITE)
+    center_text("BLOCK %d" % block[1], 200, WHITE)
+    display.refresh()
+    time.sleep(1.5)
+
+# ==========================================================
+#                   SAVE STATES
+# ==========================================================
+# A in a game suspends it instead of ending it. The game packs its state
+# into a fixed-layout record and the next launch resumes at that frame.
+# Records live in slots allocated once at boot, so suspending never
+# allocates a buffer and never fragments the heap.
+#
+# Layout per game: header struct (always starting with the RNG seed and
+# the frame counter), then for each entity pool a u16 count followed by
+# room for `cap` entries.
+SAVE_LAYOUT = {
+    "Snake":  ("<IIbbBBfH", (("<BB", 460),)),
+    "Pong":   ("<IIhhhhhfH", ()),
+    "Space":  ("<IIhfbbH", (("<hh", 5), ("<hh", 4))),
+    "Flappy": ("<IIhhhfH", (("<hhh", 4),)),
+    "Dodger": ("<IIhhfH", (("<hh", 11),)),
+    "Cave":   ("<IIhhhhhhfH", ()),
+    "Dino":   ("<IIhhBbH", (("<hhh", 8),)),
+}
+
+save_slots = {}
+saved = {}
+
+def save_size(name):
+    hfmt, pools = SAVE_LAYOUT[name]
+    size = struct.calcsize(hfmt)
+    for efmt, cap in pools:
+        size += 2 + cap * struct.calcsize(efmt)
+    return size
+
+def save_path(name):
+    return "save_%s.bin" % name.lower()
+
+def load_saves():
+    for name in SAVE_LAYOUT:
+        save_slots[name] = bytearray(save_size(name))
+        saved[name] = False
+        if SAVE_TO_FLASH:
+            try:
+                with open(save_path(name), "rb") as f:
+                    saved[name] = f.readinto(save_slots[name]) == len(save_slots[name])
+            except OSError:
+                pass
+
+def drop_saves():
+    for name in saved:
+        if saved[name] and SAVE_TO_FLASH:
+            try:
+                os.remove(save_path(name))
+            except OSError:
+                pass
+        saved[name] = False
+
+def suspend(name, frame, fields, pools=()):
+    # MicroPython's random has no getstate(): store a fresh seed instead,
+    # so everything after the resume point follows from the record alone
+    if autoplay:
+        return  # demo games never take a player's save slot
+    t0 = time.ticks_us()
+    hfmt, layout = SAVE_LAYOUT[name]
+    rec = save_slots[name]
+    struct.pack_into(hfmt, rec, 0, random.getrandbits(30), frame, *fields)
+    off = struct.calcsize(hfmt)
+    for (efmt, cap), pool in zip(layout, pools):
+        n = min(len(pool), cap)
+        size = struct.calcsize(efmt)
+        struct.pack_into("<H", rec, off, n)
+        for i in range(n):
+            struct.pack_into(efmt, rec, off + 2 + i * size, *pool[i])
+        off += 2 + cap * size
+    saved[name] = True
+    prof.suspend_us = time.ticks_diff(time.ticks_us(), t0)
+    if SAVE_TO_FLASH:
+        with open(save_path(name), "wb") as f:
+            f.write(rec)
+
+def resume(name):
+    # Returns (frame, fields, pools) and consumes the save, or None
+    if autoplay or not saved.get(name):
+        return None
+    saved[name] = False
+    if SAVE_TO_FLASH:
+        try:
+            os.remove(save_path(name))
+        except OSError:
+            pass
+    hfmt, layout = SAVE_LAYOUT[name]
+    rec = save_slots[name]
+    header = struct.unpack_from(hfmt, rec, 0)
+    random.seed(header[0])
+    off = struct.calcsize(hfmt)
+    pools = []
+    for efmt, cap in layout:
+        size = struct.calcsize(efmt)
+        n = struct.unpack_from("<H", rec, off)[0]
+        pools.append([list(struct.unpack_from(efmt, rec, off + 2 + i * size)) for i in range(n)])
+        off += 2 + cap * size
+    prof.resumed = True
+    return header[1], header[2:], pools
+
+load_saves()
+
+# ==========================================================
+#                   AI PLAYERS
+# ==========================================================
+# One player per game, called with the game's own state once per frame
+# through ai_turn() while autoplay is on. They pick their moves with
+# steer() and only see what a human would see on screen, so they can and
+# do lose.
+AI_MOVES = ((1, 0, "RIGHT"), (-1, 0, "LEFT"), (0, 1, "DOWN"), (0, -1, "UP"))
+
+def ai_turn(ai, *args):
+    # The AI stands in for a human, so its time is not frame work: the
+    # governor counts it as sleep and the profiler reports it on its own
+    t0 = time.ticks_us()
+    ai(*args)
+    us = time.ticks_diff(time.ticks_us(), t0)
+    gov.slept += us
+    prof.ai(us)
+
+def ai_toward(pos, target, slack):
+    if target < pos - slack:
+        return "LEFT"
+    if target > pos + slack:
+        return "RIGHT"
+    return None
+
+def ai_snake(snake, food, direction, cols, rows):
+    # Breadth-first search from the head to the food around the body (the
+    # field wraps). If the food is walled off, take the move that leads
+    # into the biggest open area instead.
+    blocked = bytearray(cols * rows)
+    for sx, sy in snake:
+        blocked[sy * cols + sx] = 1
+    first = bytearray(cols * rows)  # 1 + AI_MOVES index that led here
+    reach = [0, 0, 0, 0]
+    queue = []
+    hx, hy = snake[0]
+    for i, (dx, dy, _) in enumerate(AI_MOVES):
+        if dx == -direction[0] and dy == -direction[1]:
+            continue
+        c = ((hy + dy) % rows) * cols + (hx + dx) % cols
+        if not blocked[c]:
+            first[c] = i + 1
+            queue.append(c)
+    target = food[1] * cols + food[0]
+    k = 0
+    while k < len(queue):
+        c = queue[k]
+        k += 1
+        m = first[c]
+        if c == target:
+            steer(AI_MOVES[m - 1][2])
+            return
+        reach[m - 1] += 1
+        x = c % cols
+        y = c // cols
+        for dx, dy, _ in AI_MOVES:
+            n = ((y + dy) % rows) * cols + (x + dx) % cols
+            if not blocked[n] and not first[n]:
+                first[n] = m
+                queue.append(n)
+    best = max(range(4), key=lambda i: reach[i])
+    steer(AI_MOVES[best][2] if reach[best] else None)
+
+def ai_pong(px, paddle_w, py, bx, by, bdx, bdy):
+    # Work out where the ball crosses the paddle line, folding in the wall
+    # bounces, and get under it; track the ball while it flies away
+    x = bx
+    if bdy > 0:
+        span = WIDTH - 10
+        x = (bx + bdx * ((py - 10 - by) // bdy)) % (2 * span)
+        if x > span:
+            x = 2 * span - x
+    steer(ai_toward(px + paddle_w // 2, x + 5, 5))
+
+def ai_space(ship_x, ship_y, asteroids, asteroid_speed):
+    # Step out from under anything about to land, else line up with the
+    # lowest asteroid on screen and fire
+    target = None
+    for ax, ay in asteroids:
+        if abs(ax - ship_x) < 24 and ship_y - 13 - asteroid_speed * 4 < ay < ship_y + 13:
+            d = "LEFT" if ax >= ship_x else "RIGHT"
+            if (d == "LEFT" and ship_x <= 24) or (d == "RIGHT" and ship_x >= WIDTH - 24):
+                d = "RIGHT" if d == "LEFT" else "LEFT"
+            steer(d, True)
+            return
+        if 0 < ay < ship_y - 40 and (target is None or ay > target[1]):
+            target = (ax, ay)
+    if target is None:
+        steer(ai_toward(ship_x, WIDTH // 2, 10))
+    else:
+        steer(ai_toward(ship_x, target[0], 6), abs(target[0] - ship_x) < 12)
+
+def ai_flappy(x, y, vel, pipes):
+    # A flap lifts the bird 36 px, so hover in the lower part of the next
+    # gap: flap whenever the next frame would fall below that line
+    target = HEIGHT // 2
+    for p in pipes:
+        if p[0] + 24 > x:
+            target = p[2] - 12
+            break
+    steer(None, y + vel + 1 > target)
+
+DODGE_MOVES = ((None, 0, 0), ("LEFT", -13, 0), ("RIGHT", 13, 0), ("UP", 0, -13), ("DOWN", 0, 13))
+
+def ai_dodge_can(d, px, py):
+    # the same bounds game_dodger() moves the player within
+    return not ((d == "LEFT" and px <= 12) or (d == "RIGHT" and px >= WIDTH - 12)
+                or (d == "UP" and py <= 32) or (d == "DOWN" and py >= HEIGHT - 20))
+
+def ai_dodge_ok(px, py, blocks, t, depth, clear):
+    # True if some `depth` moves from (px, py), starting t frames from now,
+    # avoid every block (they fall 12 px per frame). With `clear`, the last
+    # move must also leave nothing falling towards the player: running
+    # down ahead of a block only ends at the bottom edge.
+    for d, dx, dy in DODGE_MOVES:
+        if not ai_dodge_can(d, px, py):
+            continue
+        x = px + dx
+        y = py + dy
+        for bx, by in blocks:
+            if abs(x - bx) < 20 and -20 < y - by - 12 * t < (100 if clear and depth == 1 else 20):
+                break
+        else:
+            if depth == 1 or ai_dodge_ok(x, y, blocks, t + 1, depth - 1, clear):
+                return True
+    return False
+
+def ai_dodger(px, py, blocks):
+    # Three moves ahead: it takes two sideways steps to clear a block.
+    # Of the safest moves, keep the one nearest the start position.
+    near = [b for b in blocks if -100 < py - b[1] < 150]
+    best = None
+    best_cost = 1 << 30
+    for d, dx, dy in DODGE_MOVES:
+        if not ai_dodge_can(d, px, py):
+            continue
+        x = px + dx
+        y = py + dy
+        cost = abs(x - WIDTH // 2) + abs(y - HEIGHT // 2 - 80)
+        for bx, by in near:
+            if abs(x - bx) < 20 and abs(y - by - 12) < 20:
+                cost += 20000
+                break
+        else:
+            if not ai_dodge_ok(x, y, near, 2, 2, True):
+                cost += 5000 if ai_dodge_ok(x, y, near, 2, 2, False) else 10000
+        if cost < best_cost:
+            best = d
+            best_cost = cost
+    steer(best)
+
+def ai_cave(y, vel, cave_top, cave_bottom):
+    # A flap lifts the copter 21 px: stay just below the middle
+    steer(None, y + vel + 1 > (cave_top + cave_bottom) // 2 + 8)
+
+def ai_dino(dino_x, on_ground, obstacles, speed):
+    # A jump keeps the dino above 28 px from its 3rd to its 22nd frame.
+    # Jump once the next obstacle will be past by the 20th, so it lands
+    # as early as it can, ready for the one after.
+    for ox, oy, oh in obstacles:
+        if ox + 12 > dino_x:
+            steer(None, on_ground and ox - dino_x + 12 < speed * 20)
+            return
+    steer(None)
+
 # ==========================================================
 #                   GAME 1: SNAKE
 # ==========================================================
@@ -193,9 +1186,20 @@ def game_snake():
     direction = (1, 0)
     food = (random.randint(0, cols-1), random.randint(0, rows-1))
 
-    speed = 0.16  # starts a bit easier
+    tune = TUNING["Snake"]
+    speed = tune["speed"]
+    step = tune["step"]
+    min_speed = tune["min_speed"]
     frame = 0
     score = 0
+
+    save = resume("Snake")
+    if save:
+        frame, (dx, dy, fx, fy, speed, score), (body,) = save
+        direction = (dx, dy)
+        food = (fx, fy)
+        snake = [tuple(seg) for seg in body]
+
     onboard_led.value(1)
 
     trail_colors = [CYAN, GREEN, YELLOW, MAGENTA]
@@ -203,27 +1207,27 @@ def game_snake():
     while True:
         frame += 1
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("SNAKE - A Exit", 10, BLACK)
 
         # Food with border
         fx, fy = food
-        fb.fill_rect(fx*SEG-1, 40+fy*SEG-1, SEG+2, SEG+2, WHITE)
-        fb.fill_rect(fx*SEG, 40+fy*SEG, SEG, SEG, RED)
+        draw_box(fx*SEG-1, 40+fy*SEG-1, SEG+2, SEG+2, RED, WHITE)
 
         # Snake
         for idx, (sx, sy) in enumerate(snake):
             if idx == 0:
-                fb.fill_rect(sx*SEG-1, 40+sy*SEG-1, SEG+2, SEG+2, WHITE)
-                fb.fill_rect(sx*SEG, 40+sy*SEG, SEG, SEG, GREEN)
+                draw_box(sx*SEG-1, 40+sy*SEG-1, SEG+2, SEG+2, GREEN, WHITE)
             else:
                 c = trail_colors[idx % len(trail_colors)]
-                fb.fill_rect(sx*SEG, 40+sy*SEG, SEG, SEG, c)
+                draw_rect(sx*SEG, 40+sy*SEG, SEG, SEG, c)
 
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
+        draw_score(score)
+        frame_end()
 
+        if autoplay:
+            ai_turn(ai_snake, snake, food, direction, cols, rows)
         d = get_direction()
         if d == "LEFT" and direction != (1, 0):
             direction = (-1, 0)
@@ -253,18 +1257,21 @@ def game_snake():
         else:
             snake.pop()
 
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
-
         # difficulty ramp
-        if frame % 30 == 0 and speed > 0.055:
-            speed -= 0.005
+        if frame % 30 == 0 and speed > min_speed:
+            speed -= step
 
         if frame % 30 == 0:
             gc.collect()
 
-        time.sleep(speed)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Snake", frame, (direction[0], direction[1], food[0], food[1], speed, score), (snake,))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(speed)
 
     onboard_led.value(0)
     show_game_over("Snake", score)
@@ -283,33 +1290,39 @@ def game_pong():
 
     bx = WIDTH//2
     by = HEIGHT//2
-    bdx = 3  # start a bit slower
-    bdy = 3
+    tune = TUNING["Pong"]
+    bdx = tune["ball"]
+    bdy = tune["ball"]
 
     score = 0
-    speed = 0.03  # start easier
+    speed = tune["speed"]
+    ramp = tune["ramp"]
     frame = 0
 
+    save = resume("Pong")
+    if save:
+        frame, (px, bx, by, bdx, bdy, speed, score), _ = save
+
     onboard_led.value(1)
 
     while True:
         frame += 1
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("PONG - A Exit", 10, BLACK)
 
         # Paddle with border
-        fb.fill_rect(px-2, py-2, paddle_w+4, paddle_h+4, WHITE)
-        fb.fill_rect(px, py, paddle_w, paddle_h, GREEN)
+        draw_box(px-2, py-2, paddle_w+4, paddle_h+4, GREEN, WHITE, 2)
 
         # Ball with border
-        fb.fill_rect(bx-1, by-1, 12, 12, WHITE)
-        fb.fill_rect(bx, by, 10, 10, YELLOW)
+        draw_box(bx-1, by-1, 12, 12, YELLOW, WHITE)
 
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
+        draw_score(score)
+        frame_end()
 
+        if autoplay:
+            ai_turn(ai_pong, px, paddle_w, py, bx, by, bdx, bdy)
         d = get_direction()
         if d == "LEFT" and px > 0:
             px -= 10
@@ -333,20 +1346,23 @@ def game_pong():
             beep(350, 170)
             break
 
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
-
         # difficulty ramp
         if frame % 40 == 0 and abs(bdx) < 13:
             bdx += 1 if bdx > 0 else -1
             bdy += 1 if bdy > 0 else -1
-            speed *= 0.95
+            speed *= ramp
 
         if frame % 30 == 0:
             gc.collect()
 
-        time.sleep(speed)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Pong", frame, (px, bx, by, bdx, bdy, speed, score))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(speed)
 
     onboard_led.value(0)
     show_game_over("Pong", score)
@@ -364,36 +1380,42 @@ def game_space():
     shots = []
     asteroids = [[random.randint(0, WIDTH - 14), -random.randint(30, 180)] for _ in range(4)]
 
+    tune = TUNING["Space"]
     score = 0
-    speed = 0.055  # slightly easier start
-    asteroid_speed = 5
+    speed = tune["speed"]
+    ramp = tune["ramp"]
+    asteroid_speed = tune["fall"]
     frame = 0
     shot_cooldown = 0  # will be small for fast shooting
 
+    save = resume("Space")
+    if save:
+        frame, (ship_x, speed, asteroid_speed, shot_cooldown, score), (shots, asteroids) = save
+
     onboard_led.value(1)
 
     while True:
         frame += 1
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("SPACE - A Exit", 10, BLACK)
 
         # Ship with border + cockpit
-        fb.fill_rect(ship_x - 10, ship_y - 2, 20, 15, WHITE)
-        fb.fill_rect(ship_x - 8, ship_y, 16, 11, GREEN)
-        fb.fill_rect(ship_x - 2, ship_y + 5, 4, 7, YELLOW)
+        draw_box(ship_x - 10, ship_y - 2, 20, 15, GREEN, WHITE, 2)
+        draw_rect(ship_x - 2, ship_y + 5, 4, 7, YELLOW)
 
         for sx, sy in shots:
-            fb.fill_rect(sx - 2, sy, 4, 14, WHITE)
+            draw_rect(sx - 2, sy, 4, 14, WHITE)
 
         for ax, ay in asteroids:
-            fb.fill_rect(ax, ay, 14, 14, RED)
-            fb.rect(ax, ay, 14, 14, WHITE)
+            draw_box(ax, ay, 14, 14, RED, WHITE)
 
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
+        draw_score(score)
+        frame_end()
 
+        if autoplay:
+            ai_turn(ai_space, ship_x, ship_y, asteroids, asteroid_speed)
         d = get_direction()
         if d == "LEFT" and ship_x > 14:
             ship_x -= 10
@@ -401,7 +1423,7 @@ def game_space():
             ship_x += 10
 
         # Shooting â faster: smaller cooldown
-        if (not BTN_B.value()) and shot_cooldown == 0 and len(shots) < 5:
+        if btn_b() and shot_cooldown == 0 and len(shots) < 5:
             shots.append([ship_x, ship_y])
             beep(1000, 15)
             shot_cooldown = 3   # was 6 â faster fire
@@ -446,20 +1468,23 @@ def game_space():
                 gc.collect()
                 return
 
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
-
         # difficulty ramp
         if frame % 50 == 0 and asteroid_speed < 16:
             asteroid_speed += 1
             if speed > 0.02:
-                speed *= 0.93
+                speed *= ramp
 
         if frame % 30 == 0:
             gc.collect()
 
-        time.sleep(speed)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Space", frame, (ship_x, speed, asteroid_speed, shot_cooldown, score), (shots, asteroids))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(speed)
 
     onboard_led.value(0)
     show_game_over("Space", score)
@@ -476,23 +1501,31 @@ def game_flappy():
     vel = 0
 
     pipes = []
-    gap = 95   # start easier: bigger gap
+    tune = TUNING["Flappy"]
+    gap = tune["gap"]
+    min_gap = tune["min_gap"]
+    spawn = tune["spawn"]
     frame = 0
     score = 0
-    spd = 0.03  # a bit slower start
+    spd = tune["speed"]
+    ramp = tune["ramp"]
+
+    save = resume("Flappy")
+    if save:
+        frame, (y, vel, gap, spd, score), (pipes,) = save
 
     onboard_led.value(1)
 
     while True:
         frame += 1
 
-        if frame % 80 == 0 and gap > 56:
+        if frame % 80 == 0 and gap > min_gap:
             gap -= 4
 
         if frame % 80 == 0 and spd > 0.012:
-            spd *= 0.96
+            spd *= ramp
 
-        if frame % 60 == 0:
+        if frame % spawn == 0:
             top = random.randint(36, HEIGHT - 170)
             pipes.append([WIDTH, top, top + gap])
 
@@ -505,24 +1538,25 @@ def game_flappy():
             beep(330, 240)
             break
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("FLAPPY - A Exit", 10, BLACK)
 
         # Bird with outline and "wing"
-        fb.fill_rect(x - 2, y - 2, 18, 18, WHITE)
-        fb.fill_rect(x, y, 14, 14, GREEN)
-        fb.fill_rect(x + 8, y + 3, 5, 3, YELLOW)
+        draw_box(x - 2, y - 2, 18, 18, GREEN, WHITE, 2)
+        draw_rect(x + 8, y + 3, 5, 3, YELLOW)
 
         for p in pipes:
-            fb.fill_rect(p[0], 0, 24, p[1], RED)
-            fb.fill_rect(p[0], p[2], 24, HEIGHT - p[2], RED)
-            fb.rect(p[0], p[1], 24, gap, WHITE)
+            draw_rect(p[0], 0, 24, p[1], RED)
+            draw_rect(p[0], p[2], 24, HEIGHT - p[2], RED)
+            draw_ring(p[0], p[1], 24, gap, WHITE)
 
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
+        draw_score(score)
+        frame_end()
 
-        if not BTN_B.value():
+        if autoplay:
+            ai_turn(ai_flappy, x, y, vel, pipes)
+        if btn_b():
             vel = -9
             beep(820, 23)
 
@@ -542,14 +1576,17 @@ def game_flappy():
 
         score = frame // 80
 
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
-
         if frame % 40 == 0:
             gc.collect()
 
-        time.sleep(spd)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Flappy", frame, (y, vel, gap, spd, score), (pipes,))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(spd)
 
     onboard_led.value(0)
     show_game_over("Flappy", score)
@@ -564,39 +1601,46 @@ def game_dodger():
     px = WIDTH // 2
     py = HEIGHT // 2 + 80
 
+    tune = TUNING["Dodger"]
     score = 0
-    speed = 0.04  # a bit slower start
-    nblocks = 4
+    speed = tune["speed"]
+    ramp = tune["ramp"]
+    spawn = tune["spawn"]
+    nblocks = tune["blocks"]
     blocks = [[random.randint(10, WIDTH - 30), -random.randint(30, 250)] for _ in range(nblocks)]
     frame = 0
 
+    save = resume("Dodger")
+    if save:
+        frame, (px, py, speed, score), (blocks,) = save
+
     onboard_led.value(1)
 
     while True:
         frame += 1
 
-        if frame % 60 == 0 and len(blocks) < 11:
+        if frame % spawn == 0 and len(blocks) < 11:
             blocks.append([random.randint(10, WIDTH - 30), -random.randint(30, 250)])
 
         if frame % 60 == 0 and speed > 0.012:
-            speed *= 0.96
+            speed *= ramp
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("DODGER - A Exit", 10, BLACK)
 
         # Player with glow
-        fb.fill_rect(px - 14, py - 14, 28, 28, CYAN)
-        fb.fill_rect(px - 12, py - 12, 24, 24, WHITE)
-        fb.fill_rect(px - 8, py - 8, 16, 16, YELLOW)
+        draw_ring(px - 14, py - 14, 28, 28, CYAN, 2)
+        draw_box(px - 12, py - 12, 24, 24, YELLOW, WHITE, 4)
 
         for bx, by in blocks:
-            fb.fill_rect(bx, by, 18, 18, RED)
-            fb.rect(bx, by, 18, 18, WHITE)
+            draw_box(bx, by, 18, 18, RED, WHITE)
 
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
+        draw_score(score)
+        frame_end()
 
+        if autoplay:
+            ai_turn(ai_dodger, px, py, blocks)
         d = get_direction()
         if d == "LEFT" and px > 12:
             px -= 13
@@ -622,14 +1666,17 @@ def game_dodger():
                 gc.collect()
                 return
 
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
-
         if frame % 40 == 0:
             gc.collect()
 
-        time.sleep(speed)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Dodger", frame, (px, py, speed, score), (blocks,))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(speed)
 
     onboard_led.value(0)
     show_game_over("Dodger", score)
@@ -648,26 +1695,35 @@ def game_cave():
     cave_top = 40
     cave_bottom = HEIGHT - 40
     scroll = 0
-    gap = 190   # easier start
-    speed = 0.035
+    tune = TUNING["Cave"]
+    gap = tune["gap"]
+    min_gap = tune["min_gap"]
+    speed = tune["speed"]
+    ramp = tune["ramp"]
     frame = 0
     score = 0
 
+    save = resume("Cave")
+    if save:
+        frame, (y, vel, cave_top, cave_bottom, scroll, gap, speed, score), _ = save
+
     onboard_led.value(1)
 
     while True:
         frame += 1
 
         # difficulty ramp
-        if frame % 70 == 0 and gap > 90:
+        if frame % 70 == 0 and gap > min_gap:
             gap -= 6
         if frame % 60 == 0 and speed > 0.014:
-            speed *= 0.97
+            speed *= ramp
 
         vel += 1
         y += vel
 
-        if not BTN_B.value():
+        if autoplay:
+            ai_turn(ai_cave, y, vel, cave_top, cave_bottom)
+        if btn_b():
             vel = -7
             beep(700, 15)
 
@@ -686,29 +1742,31 @@ def game_cave():
             if cave_bottom > HEIGHT - 20:
                 cave_bottom = HEIGHT - 20
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("CAVE - A Exit", 10, BLACK)
 
-        fb.fill_rect(0, 0, WIDTH, cave_top, RED)
-        fb.fill_rect(0, cave_bottom, WIDTH, HEIGHT - cave_bottom, RED)
+        draw_rect(0, 0, WIDTH, cave_top, RED)
+        draw_rect(0, cave_bottom, WIDTH, HEIGHT - cave_bottom, RED)
 
         # Helicopter: bold square
-        fb.fill_rect(x - 2, y - 2, 20, 20, WHITE)
-        fb.fill_rect(x, y, 16, 16, GREEN)
+        draw_box(x - 2, y - 2, 20, 20, GREEN, WHITE, 2)
 
         score = frame // 20
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
-
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
+        draw_score(score)
+        frame_end()
 
         if frame % 40 == 0:
             gc.collect()
 
-        time.sleep(speed)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Cave", frame, (y, vel, cave_top, cave_bottom, scroll, gap, speed, score))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(speed)
 
     onboard_led.value(0)
     show_game_over("Cave", score)
@@ -729,8 +1787,16 @@ def game_dino():
 
     obstacles = []
     frame = 0
+    tune = TUNING["Dino"]
     score = 0
-    speed = 6  # world scroll speed (starts easy)
+    speed = tune["speed"]  # world scroll speed
+    spawn = tune["spawn"]
+    min_spawn = tune["min_spawn"]
+
+    save = resume("Dino")
+    if save:
+        frame, (dino_y, dino_vy, on_ground, speed, score), (obstacles,) = save
+        on_ground = bool(on_ground)
 
     onboard_led.value(1)
 
@@ -738,7 +1804,7 @@ def game_dino():
         frame += 1
 
         # spawn obstacles â less frequent at start, then faster
-        if frame % max(25, 80 - score*2) == 0:
+        if frame % max(min_spawn, spawn - score*2) == 0:
             h = random.randint(20, 28)
             obstacles.append([WIDTH, ground_y - h, h])
 
@@ -755,29 +1821,29 @@ def game_dino():
             dino_vy = 0
             on_ground = True
 
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("DINO - A Exit", 10, BLACK)
 
         # ground line
-        fb.fill_rect(0, ground_y, WIDTH, 2, WHITE)
+        draw_rect(0, ground_y, WIDTH, 2, WHITE)
 
         # dino sprite (border + body)
-        fb.fill_rect(dino_x - 2, dino_y - 2, 24, 24, WHITE)
-        fb.fill_rect(dino_x, dino_y, 20, 20, GREEN)
-        fb.fill_rect(dino_x + 12, dino_y + 4, 3, 3, BLACK)  # eye
+        draw_box(dino_x - 2, dino_y - 2, 24, 24, GREEN, WHITE, 2)
+        draw_rect(dino_x + 12, dino_y + 4, 3, 3, BLACK)  # eye
 
         # obstacles
         for ox, oy, oh in obstacles:
-            fb.fill_rect(ox, oy, 12, oh, RED)
-            fb.rect(ox, oy, 12, oh, WHITE)
+            draw_box(ox, oy, 12, oh, RED, WHITE)
 
         score = frame // 10
-        center_text("SCORE %d" % score, 300, WHITE)
-        display.refresh()
+        draw_score(score)
+        frame_end()
 
         # jump
-        if not BTN_B.value() and on_ground:
+        if autoplay:
+            ai_turn(ai_dino, dino_x, on_ground, obstacles, speed)
+        if btn_b() and on_ground:
             dino_vy = -13
             on_ground = False
             beep(840, 20)
@@ -798,20 +1864,194 @@ def game_dino():
                 gc.collect()
                 return
 
-        if not BTN_A.value():
-            debounce_button(BTN_A)
-            break
-
         if frame % 40 == 0:
             gc.collect()
 
-        time.sleep(0.02)
+        if btn_a():
+            debounce_button(BTN_A)
+            suspend("Dino", frame, (dino_y, dino_vy, on_ground, speed, score), (obstacles,))
+            onboard_led.value(0)
+            clean()
+            return
+
+        frame_sleep(0.02)
 
     onboard_led.value(0)
     show_game_over("Dino", score)
     clean()
     gc.collect()
 
+# ==========================================================
+#                   GAME 8: PONG LINK (two consoles)
+# ==========================================================
+# Both consoles run the same simulation from the same inputs (see
+# link.py), so only joystick bits cross the cable. P0 owns the bottom
+# paddle and P1 the top one; P1 sees the field mirrored so their own
+# paddle is at the bottom too.
+LINK_LEFT = 1
+LINK_RIGHT = 2
+LINK_QUIT = 4
+
+def pong_link_step(st, in0, in1):
+    bx, by, bdx, bdy, p0, p1, s0, s1 = st
+
+    if in0 & LINK_LEFT and p0 > 0:
+        p0 -= 10
+    elif in0 & LINK_RIGHT and p0 < WIDTH - 50:
+        p0 += 10
+    if in1 & LINK_LEFT and p1 > 0:
+        p1 -= 10
+    elif in1 & LINK_RIGHT and p1 < WIDTH - 50:
+        p1 += 10
+
+    bx += bdx
+    by += bdy
+    if bx <= 0 or bx >= WIDTH - 10:
+        bdx = -bdx
+
+    # paddles at y=272 (P0) and y=40 (P1), mirror images around the middle
+    if bdy > 0 and 262 <= by <= 272 and p0 - 10 <= bx <= p0 + 50:
+        bdy = -bdy
+    elif bdy < 0 and 38 <= by <= 48 and p1 - 10 <= bx <= p1 + 50:
+        bdy = -bdy
+
+    if by >= 290 or by <= 20:
+        if by >= 290:
+            s1 += 1
+            bdy = 3   # serve towards whoever lost the point
+        else:
+            s0 += 1
+            bdy = -3
+        bx = WIDTH // 2 - 5
+        by = HEIGHT // 2 - 5
+        bdx = 3 if (s0 + s1) % 2 else -3
+
+    st[0] = bx
+    st[1] = by
+    st[2] = bdx
+    st[3] = bdy
+    st[4] = p0
+    st[5] = p1
+    st[6] = s0
+    st[7] = s1
+
+def game_pong_link():
+    import link   # only loaded (and compiled) when link play starts
+    clean()
+    port = UART(LINK_UART, LINK_BAUD, tx=Pin(LINK_TX), rx=Pin(LINK_RX))
+    lk = link.Link(port)
+    onboard_led.value(1)
+
+    # Handshake: announce ourselves until the other console answers
+    last = time.ticks_add(time.ticks_ms(), -1000)
+    while not lk.connected():
+        if time.ticks_diff(time.ticks_ms(), last) >= 200:
+            last = time.ticks_ms()
+            lk.hello()
+            frame_begin()
+            draw_rect(0, 0, WIDTH, 30, BAR_TOP)
+            center_text("PONG LINK - A Exit", 10, BLACK)
+            center_text("WAITING FOR", 140, WHITE)
+            center_text("PLAYER 2", 160, WHITE)
+            frame_end()
+        lk.poll()
+        if lk.error or btn_a():
+            debounce_button(BTN_A)
+            port.deinit()
+            onboard_led.value(0)
+            if lk.error:
+                # e.g. "version": the other console runs another link.py
+                show_game_over("LINK " + lk.error, 0)
+            clean()
+            return
+        time.sleep_ms(5)
+
+    me = lk.player
+    st = [WIDTH // 2 - 5, HEIGHT // 2 - 5, 3, 3, WIDTH // 2 - 25, WIDTH // 2 - 25, 0, 0]
+    frame = 0
+    result = None
+
+    while result is None:
+        t0 = time.ticks_ms()
+
+        bits = 0
+        d = get_direction()
+        if d == "LEFT":
+            bits |= LINK_LEFT
+        elif d == "RIGHT":
+            bits |= LINK_RIGHT
+        if btn_a():
+            bits |= LINK_QUIT
+        lk.send_input(frame + lk.delay, bits)
+
+        # Lockstep: this frame needs the peer's input before it can run
+        theirs = lk.remote_input(frame)
+        stall = t0
+        while theirs < 0:
+            now = time.ticks_ms()
+            if time.ticks_diff(now, t0) > LINK_TIMEOUT_MS:
+                result = "LINK LOST"
+                break
+            if time.ticks_diff(now, stall) > LINK_FRAME_MS * 2:
+                stall = now
+                lk.resend()   # a packet got lost on the way
+            time.sleep_ms(1)
+            lk.poll()
+            theirs = lk.remote_input(frame)
+        if result:
+            break
+        mine = lk.local_input(frame)
+        lk.consume(frame)
+
+        if me == 0:
+            in0, in1 = mine, theirs
+        else:
+            in0, in1 = theirs, mine
+        if (in0 | in1) & LINK_QUIT:
+            debounce_button(BTN_A)
+            result = "QUIT"
+            break
+
+        pong_link_step(st, in0, in1)
+        frame += 1
+        if frame % lk.check_every == 0:
+            lk.check(frame, binascii.crc32(struct.pack("<9h", frame & 0x7FFF, *st)))
+        lk.poll()
+        if lk.error:
+            result = "DESYNC"
+            break
+        mine_score = st[6 + me]
+        their_score = st[7 - me]
+        if mine_score >= 5 or their_score >= 5:
+            result = "YOU WIN" if mine_score > their_score else "YOU LOSE"
+            beep(900 if mine_score > their_score else 300, 200)
+
+        bx, by, _, _, p0, p1, s0, s1 = st
+        if me == 1:
+            # mirror: our paddle (top in the simulation) is drawn at the bottom
+            by = HEIGHT - by - 10
+            p0, p1 = p1, p0
+
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
+        center_text("PONG LINK - A Exit", 10, BLACK)
+        draw_box(p0 - 2, 270, 54, 12, GREEN, WHITE, 2)
+        draw_box(p1 - 2, 38, 54, 12, MAGENTA, WHITE, 2)
+        draw_box(bx - 1, by - 1, 12, 12, YELLOW, WHITE)
+        center_text("YOU %d - %d THEM" % (st[6 + me], st[7 - me]), 300, WHITE)
+        frame_end()
+
+        wait = LINK_FRAME_MS - time.ticks_diff(time.ticks_ms(), t0)
+        if wait > 0:
+            frame_sleep(wait / 1000)
+
+    print("[link] frames=%d sent=%d bytes (%d/frame) bad=%d %s" % (
+        frame, lk.sent, lk.sent // max(1, frame), lk.bad, result))
+    port.deinit()
+    onboard_led.value(0)
+    show_game_over("Pong Link" if result == "QUIT" else result, st[6 + me])
+    clean()
+
 # ==========================================================
 #                   MAIN MENU
 # ==========================================================
@@ -822,7 +2062,8 @@ GAMES = [
     "Flappy",
     "Dodger",
     "Cave",
-    "Dino"
+    "Dino",
+    "Pong Link"
 ]
 
 GAME_FUNCS = [
@@ -832,24 +2073,117 @@ GAME_FUNCS = [
     game_flappy,
     game_dodger,
     game_cave,
-    game_dino
+    game_dino,
+    game_pong_link
 ]
 
+# Declared heap budget per game: (free bytes, largest contiguous block).
+# Snake is the big one: up to 460 body tuples plus the list holding them.
+GAME_MEM = [
+    (16000, 4096),
+    (4000, 1024),
+    (6000, 1024),
+    (6000, 1024),
+    (6000, 1024),
+    (4000, 1024),
+    (6000, 1024),
+    (20000, 4096)   # importing link.py compiles it on the heap
+]
+
+# Render scale per game: 2 draws at 120x160 and frees ~112 KB while it runs
+GAME_SCALE = [2, 2, 2, 2, 2, 2, 2, 1]
+
+# Games with an AI player, for attract mode (Pong Link needs a second console)
+DEMO_GAMES = [0, 1, 2, 3, 4, 5, 6]
+
+def mem_check(sel):
+    # Catch a full or fragmented heap here instead of as a MemoryError mid-game
+    need, block = GAME_MEM[sel]
+    gc.collect()
+    free = gc.mem_free()
+    if free >= need and block_fits(block):
+        return True
+    print("[mem] %s refused: free=%d need=%d block=%d" % (GAMES[sel], free, need, block))
+    show_low_memory(GAMES[sel], free, (need, block))
+    clean()
+    return False
+
+def launch(sel):
+    set_render_scale(GAME_SCALE[sel])
+    if mem_check(sel):
+        prof.start(GAMES[sel])
+        prof.t_enter = time.ticks_us()
+        gov.start()
+        GAME_FUNCS[sel]()
+        gov.stop()
+        prof.stop()
+    # back to full resolution for the menu; the game's garbage is gone
+    # by now, but if the heap is too fragmented the menu runs halved
+    set_render_scale(1)
+
+def attract(sel):
+    # Play the demo games in turn with their AI players until a human
+    # touches a control; return the game that was on so the menu shows it
+    global autoplay, autoplay_end, autoplay_quit
+    autoplay_quit = False
+    i = DEMO_GAMES.index(sel) if sel in DEMO_GAMES else 0
+    while True:
+        sel = DEMO_GAMES[i]
+        autoplay = True
+        autoplay_end = time.ticks_add(time.ticks_ms(), ATTRACT_GAME_MS)
+        launch(sel)
+        autoplay = False
+        autoplay_end = None
+        gc.collect()
+        if autoplay_quit or human_input():
+            break
+        i = (i + 1) % len(DEMO_GAMES)
+    # swallow the press that ended the demo so the menu does not act on it
+    while human_input():
+        time.sleep_ms(10)
+    return sel
+
+boot_ms = -1  # ticks_ms() when the first menu frame was shown
+
+def boot():
+    # The panel has been coming out of reset since the driver was created
+    global fb
+    onboard_led.value(1)
+    display.init_finish()
+
+    # Splash from one 16-line band: panel RAM is random after power-up, so
+    # blank it before DISPON, then show the title while the 150 KB
+    # framebuffer is allocated
+    band = bytearray(WIDTH * 16 * 2)
+    display.blit(band, 0, 0, WIDTH, 16, HEIGHT // 16)
+    display.on()
+    splash = framebuf.FrameBuffer(band, WIDTH, 16, framebuf.RGB565)
+    splash.text("ARCADE PRO", (WIDTH - 80) // 2, 4, YELLOW)
+    display.blit(band, 0, HEIGHT // 2 - 8, WIDTH, 16)
+    splash = None
+    band = None
+
+    display.alloc()
+    fb = display.fb
+
 def main():
+    global boot_ms
+    boot()
     sel = 0
-    onboard_led.value(1)
-    time.sleep(0.2)
-    onboard_led.value(0)
+    idle = time.ticks_ms()
+    a_held = False
 
     while True:
-        fb.fill(BLACK)
-        fb.fill_rect(0, 0, WIDTH, 30, BAR_TOP)
+        frame_begin()
+        draw_rect(0, 0, WIDTH, 30, BAR_TOP)
         center_text("ARCADE PRO", 10, BLACK)
 
-        fb.fill_rect(0, HEIGHT - 20, WIDTH, 20, BAR_TOP)
-        fb.text("B=PLAY  A=RESET", 42, HEIGHT - 15, BLACK)
+        draw_rect(0, HEIGHT - 20, WIDTH, 20, BAR_TOP)
+        draw_text("B=PLAY  A=RESET", 42, HEIGHT - 15, BLACK)
 
         d = get_direction()
+        if d is not None or human_input():
+            idle = time.ticks_ms()
         if d == "DOWN":
             sel = (sel + 1) % len(GAMES)
             beep(200, 16)
@@ -862,27 +2196,48 @@ def main():
         for i, g in enumerate(GAMES):
             y = 50 + i * 30
             if i == sel:
-                fb.fill_rect(20, y - 2, 200, 18, BAR_SEL)
-                fb.text(g, 80, y + 2, BLACK)
+                draw_rect(20, y - 2, 200, 18, BAR_SEL)
+                draw_text(g, 80, y + 2, BLACK)
             else:
-                fb.text(g, 80, y + 2, WHITE)
+                draw_text(g, 80, y + 2, WHITE)
+            if saved.get(g):
+                draw_text("II", 190, y + 2, BLACK if i == sel else CYAN)
 
-        display.refresh()
+        frame_end()
+
+        if boot_ms < 0:
+            boot_ms = time.ticks_ms()
+            onboard_led.value(0)
+            print("[boot] menu at %d ms since reset, %d ms after main.py started" % (
+                boot_ms, time.ticks_diff(boot_ms, BOOT_T0)))
+
+        if time.ticks_diff(time.ticks_ms(), idle) > ATTRACT_IDLE_MS:
+            sel = attract(sel)
+            idle = time.ticks_ms()
 
         if not BTN_B.value():
             debounce_button(BTN_B)
             beep(620, 33)
-            center_text("LOADING...", 150, RED)
-            display.refresh()
-            time.sleep(0.32)
-            GAME_FUNCS[sel]()
+            if not saved.get(GAMES[sel]):
+                center_text("LOADING...", 150, RED)
+                display.refresh()
+                time.sleep(0.32)
+            launch(sel)
             gc.collect()
+            idle = time.ticks_ms()
+            # A suspends a game and returns here at once, maybe still held:
+            # only a fresh press may reset the saves
+            a_held = True
 
-        if not BTN_A.value():
+        a = not BTN_A.value()
+        if a and not a_held:
             debounce_button(BTN_A)
             sel = 0
+            drop_saves()
             beep(290, 29)
             time.sleep(0.17)
             gc.collect()
+        a_held = a
 
-main()
+if __name__ == "__main__":
+    main()
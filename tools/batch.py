@@ -0,0 +1,208 @@
+"""Sweep game difficulty over many headless AI sessions on all cores.
+
+A session is one life of a game played by its AI player (tools/hostsim.py),
+with one seed and one set of TUNING values from main.py, cut off after
+--frames. Sessions run on a process pool, each on its own virtual clock.
+Every session becomes one entry in each column of a JSON results file: score,
+survival, pixels written per frame, host time per frame and, apart from it,
+host time in the AI player per frame. A summary per game and parameter set
+is printed at the end.
+
+    python tools/batch.py --game Flappy --seeds 200 --set gap=80,95,110
+    python tools/batch.py --game Dodger --set ramp=0.94,0.96,0.98 --set spawn=40,60
+    python tools/batch.py --seeds 50 --out baseline.json    # every AI game as tuned
+
+--set applies to each selected game that has that TUNING key.
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostsim  # noqa: E402
+
+COLUMNS = ("game", "seed", "score", "frames", "died", "survival_s",
+           "px_avg", "px_peak", "host_us_avg", "host_us_p50", "host_us_p95", "host_us_max",
+           "ai_us_avg", "ai_us_max")
+
+_m = None
+_defaults = None
+
+
+def init():
+    global _m, _defaults
+    with contextlib.redirect_stdout(io.StringIO()):
+        _m = hostsim.load()
+    _defaults = {name: dict(tune) for name, tune in _m.TUNING.items()}
+
+
+def percentile(values, q):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+def run(task):
+    index, sel, params, seed, frames = task
+    m = _m
+    name = m.GAMES[sel]
+    tune = m.TUNING[name]
+    tune.clear()
+    tune.update(_defaults[name])
+    tune.update(params)
+
+    px = []
+    cost = []
+    clock = []
+    ai = []
+    last = [0.0]
+    thinking = [0.0]
+    ai_turn = m.ai_turn
+
+    def timed_turn(player, *args):
+        t0 = time.perf_counter()
+        ai_turn(player, *args)
+        thinking[0] += time.perf_counter() - t0
+
+    def hook():
+        now = time.perf_counter()
+        cost.append(now - last[0] - thinking[0])  # the AI is not frame work
+        ai.append(thinking[0])
+        last[0] = now
+        thinking[0] = 0.0
+        px.append(m.px_last)
+        clock.append(m.clock.us)
+
+    random.seed(seed)
+    m.hud_score = 0
+    v0 = m.clock.us
+    m.display.hooks.append(hook)
+    m.ai_turn = timed_turn
+    last[0] = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            n, died = hostsim.session(m, sel, frames)
+    finally:
+        m.ai_turn = ai_turn
+        m.display.hooks.remove(hook)
+
+    px = px[:n]
+    us = [c * 1e6 for c in cost[1:n]]  # the first frame includes game setup
+    ai_us = [a * 1e6 for a in ai[1:n]]
+    row = {
+        "game": name,
+        "seed": seed,
+        "score": m.hud_score,
+        "frames": n,
+        "died": died,
+        "survival_s": round((clock[n - 1] - v0) / 1e6, 3) if n else 0.0,
+        "px_avg": sum(px) // max(1, len(px)),
+        "px_peak": max(px, default=0),
+        "host_us_avg": round(sum(us) / max(1, len(us)), 1),
+        "host_us_p50": round(percentile(us, 0.5), 1),
+        "host_us_p95": round(percentile(us, 0.95), 1),
+        "host_us_max": round(max(us, default=0), 1),
+        "ai_us_avg": round(sum(ai_us) / max(1, len(ai_us)), 1),
+        "ai_us_max": round(max(ai_us, default=0), 1),
+    }
+    return index, params, row
+
+
+def parse_sets(specs):
+    sweep = {}
+    for spec in specs or ():
+        key, _, values = spec.partition("=")
+        if not values:
+            sys.exit("--set wants key=v1,v2,...: %r" % spec)
+        sweep[key] = [float(v) if "." in v else int(v) for v in values.split(",")]
+    return sweep
+
+
+def summarize(rows, keys):
+    groups = {}
+    for row in rows:
+        label = " ".join("%s=%s" % (k, row[k]) for k in keys if row[k] is not None)
+        groups.setdefault((row["game"], label), []).append(row)
+    print("%-7s %-28s %5s %6s %7s %6s %6s %8s %9s %7s %8s %7s" % (
+        "game", "params", "n", "died%", "score", "p10", "p90",
+        "frames", "surv_s", "px_avg", "us_p95", "ai_us"))
+    for (game, label), g in groups.items():
+        scores = [r["score"] for r in g]
+        n = len(g)
+        print("%-7s %-28s %5d %6.1f %7.1f %6d %6d %8.0f %9.1f %7d %8.1f %7.1f" % (
+            game, label or "-", n, 100.0 * sum(r["died"] for r in g) / n,
+            sum(scores) / n, percentile(scores, 0.1), percentile(scores, 0.9),
+            sum(r["frames"] for r in g) / n, sum(r["survival_s"] for r in g) / n,
+            sum(r["px_avg"] for r in g) // n, sum(r["host_us_p95"] for r in g) / n,
+            sum(r["ai_us_avg"] for r in g) / n))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--game", action="append", help="game name (repeatable, default: all with an AI)")
+    ap.add_argument("--set", action="append", metavar="KEY=V1,V2",
+                    help="TUNING values to sweep (repeatable: all combinations run)")
+    ap.add_argument("--seeds", type=int, default=100, help="sessions per game and parameter set")
+    ap.add_argument("--seed-base", type=int, default=0)
+    ap.add_argument("--frames", type=int, default=3000, help="cut a session off after this many frames")
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--out", default="batch.json", help="columnar JSON results")
+    args = ap.parse_args()
+
+    init()  # same module the workers load, for names and defaults
+    games = [_m.GAMES[i] for i in _m.DEMO_GAMES]
+    names = [g.lower() for g in games]
+    sels = _m.DEMO_GAMES
+    if args.game:
+        try:
+            sels = [_m.DEMO_GAMES[names.index(g.lower())] for g in args.game]
+        except ValueError:
+            sys.exit("games with an AI: %s" % ", ".join(games))
+
+    sweep = parse_sets(args.set)
+    keys = sorted(sweep)
+    for k in keys:
+        if not any(k in _defaults[_m.GAMES[sel]] for sel in sels):
+            sys.exit("no selected game has TUNING key %r" % k)
+    tasks = []
+    for sel in sels:
+        tune = _defaults[_m.GAMES[sel]]
+        own = [k for k in keys if k in tune]
+        for combo in itertools.product(*(sweep[k] for k in own)):
+            params = dict(zip(own, combo))
+            for seed in range(args.seed_base, args.seed_base + args.seeds):
+                tasks.append((len(tasks), sel, params, seed, args.frames))
+
+    t0 = time.perf_counter()
+    rows = [None] * len(tasks)
+    chunk = max(1, len(tasks) // (args.workers * 16))
+    with multiprocessing.Pool(args.workers, initializer=init) as pool:
+        done = 0
+        for index, params, row in pool.imap_unordered(run, tasks, chunk):
+            for k in keys:
+                row[k] = params.get(k)
+            rows[index] = row
+            done += 1
+            if done % max(1, len(tasks) // 20) == 0 or done == len(tasks):
+                print("%d/%d sessions, %.1fs" % (done, len(tasks), time.perf_counter() - t0),
+                      file=sys.stderr)
+
+    columns = {c: [r[c] for r in rows] for c in COLUMNS + tuple(keys)}
+    with open(args.out, "w") as f:
+        json.dump(columns, f, separators=(",", ":"))
+
+    summarize(rows, keys)
+    print("%d sessions, %d frames on %d workers in %.1fs -> %s" % (
+        len(rows), sum(columns["frames"]), args.workers, time.perf_counter() - t0, args.out))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Host side of the console's framebuffer stream.
+
+Starts streaming on the console's USB serial port, rebuilds every frame from
+the row deltas and writes them out as images, a video, or a raw capture that
+can be decoded again later.
+
+    python tools/fbstream.py /dev/ttyACM0 --out frames/
+    python tools/fbstream.py /dev/ttyACM0 --video run.mp4 --interval 50
+    python tools/fbstream.py /dev/ttyACM0 --raw run.bin
+    python tools/fbstream.py --from run.bin --out frames/
+
+Needs pyserial for live capture, Pillow for PNG output (PPM otherwise) and
+ffmpeg on PATH for --video.
+"""
+import argparse
+import os
+import struct
+import subprocess
+import sys
+
+MAGIC = b"\xa5\x5aF"
+ACK = b"\x06"
+PANEL = (240, 320)
+
+
+class Source:
+    def __init__(self, f, raw=None):
+        self.f = f
+        self.raw = raw
+
+    def read(self, n):
+        data = b""
+        while len(data) < n:
+            chunk = self.f.read(n - len(data))
+            if not chunk:
+                if hasattr(self.f, "in_waiting"):
+                    continue  # serial read timed out, keep waiting
+                raise EOFError
+            data += chunk
+        if self.raw:
+            self.raw.write(data)
+        return data
+
+
+def sync(src, echo):
+    # Skip anything between frames (print() output from the console)
+    window = b""
+    text = bytearray()
+    while window != MAGIC:
+        b = src.read(1)
+        window = (window + b)[-3:]
+        if echo:
+            if b == b"\n":
+                line = bytes(text).rstrip(b"\r")
+                print(line.decode("ascii", "replace"), file=sys.stderr)
+                text.clear()
+            else:
+                text += b
+
+
+def read_frame(src, frame, echo):
+    sync(src, echo)
+    seq, w, h, nrows = struct.unpack(">HHHH", src.read(8))
+    if len(frame) != w * h * 2:
+        frame[:] = bytes(w * h * 2)
+    stride = w * 2
+    for _ in range(nrows):
+        y_hi, y_lo, runs = src.read(3)
+        row = bytearray()
+        for i in range(runs):
+            count, hi, lo = src.read(3)
+            row += bytes((hi, lo)) * count
+        y = (y_hi << 8) | y_lo
+        frame[y * stride:(y + 1) * stride] = row[:stride]
+    return seq, w, h
+
+
+def to_panel(frame, w, h):
+    """Half-resolution games stream their 120x160 framebuffer: double every
+    pixel and row, as the console's scanout does, so all output is panel
+    sized. Returns (frame, w, h)."""
+    s = PANEL[0] // w
+    if s < 2 or (w * s, h * s) != PANEL:
+        return frame, w, h
+    stride = w * 2
+    out = bytearray()
+    wide = bytearray(stride * s)
+    for y in range(h):
+        row = frame[y * stride:(y + 1) * stride]
+        for k in range(s):
+            wide[2 * k::2 * s] = row[0::2]
+            wide[2 * k + 1::2 * s] = row[1::2]
+        out += wide * s
+    return out, w * s, h * s
+
+
+def to_rgb(frame):
+    rgb = bytearray(len(frame) // 2 * 3)
+    o = 0
+    for i in range(0, len(frame), 2):
+        v = (frame[i] << 8) | frame[i + 1]
+        r = (v >> 11) & 0x1F
+        g = (v >> 5) & 0x3F
+        b = v & 0x1F
+        rgb[o] = (r << 3) | (r >> 2)
+        rgb[o + 1] = (g << 2) | (g >> 4)
+        rgb[o + 2] = (b << 3) | (b >> 2)
+        o += 3
+    return bytes(rgb)
+
+
+def save_image(path, w, h, rgb):
+    try:
+        from PIL import Image
+    except ImportError:
+        with open(path + ".ppm", "wb") as f:
+            f.write(b"P6 %d %d 255\n" % (w, h))
+            f.write(rgb)
+        return
+    Image.frombytes("RGB", (w, h), rgb).save(path + ".png")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("port", nargs="?", help="console serial port, e.g. /dev/ttyACM0")
+    ap.add_argument("--from", dest="src", help="decode a capture made with --raw")
+    ap.add_argument("--interval", type=int, default=100, help="ms between frames (10 or more)")
+    ap.add_argument("--out", help="directory for one image per frame")
+    ap.add_argument("--video", help="encode frames with ffmpeg into this file")
+    ap.add_argument("--fps", type=int, default=10, help="video frame rate")
+    ap.add_argument("--raw", help="also record the undecoded stream here")
+    ap.add_argument("--frames", type=int, default=0, help="stop after N frames")
+    ap.add_argument("--quiet", action="store_true", help="do not echo console prints")
+    args = ap.parse_args()
+
+    if not args.port and not args.src:
+        ap.error("need a serial port or --from")
+
+    port = None
+    if args.src:
+        f = open(args.src, "rb")
+    else:
+        try:
+            import serial
+        except ImportError:
+            sys.exit("live capture needs pyserial: pip install pyserial")
+        port = serial.Serial(args.port, 115200, timeout=1)
+        # ASCII digits: a raw 0x03 byte would reach the console as Ctrl-C
+        port.write(b"S%d\n" % max(10, min(99999, args.interval)))
+        f = port
+
+    raw = open(args.raw, "wb") if args.raw else None
+    src = Source(f, raw)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+
+    ffmpeg = None
+    frame = bytearray()
+    n = 0
+    try:
+        while not args.frames or n < args.frames:
+            try:
+                seq, w, h = read_frame(src, frame, not args.quiet)
+            except EOFError:
+                break
+            if port:
+                port.write(ACK)
+            n += 1
+            full, w, h = to_panel(frame, w, h)
+            rgb = to_rgb(full)
+            if args.out:
+                save_image(os.path.join(args.out, "frame_%06d" % n), w, h, rgb)
+            if args.video:
+                if ffmpeg is None:
+                    ffmpeg = subprocess.Popen([
+                        "ffmpeg", "-loglevel", "error", "-y",
+                        "-f", "rawvideo", "-pix_fmt", "rgb24",
+                        "-s", "%dx%d" % (w, h), "-r", str(args.fps),
+                        "-i", "-", "-pix_fmt", "yuv420p", args.video,
+                    ], stdin=subprocess.PIPE)
+                ffmpeg.stdin.write(rgb)
+            print("frame %d seq %d %dx%d" % (n, seq, w, h), file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if port:
+            port.write(b"X")
+            port.close()
+        if raw:
+            raw.close()
+        if ffmpeg:
+            ffmpeg.stdin.close()
+            ffmpeg.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""Run the console's games headless on a PC, played by their AI players.
+
+main.py is loaded as-is with stand-ins for the MicroPython hardware modules
+(machine, framebuf, micropython, gc) and a virtual clock, so sleeps cost
+nothing and a game runs as fast as the host can simulate it. Every game
+loop, AI player, draw call and profiler hook runs just as on the console;
+only the panel and the heap figures are fake. Meant for soak runs in CI:
+any exception fails the run.
+
+With --heap, main.py's bytearrays share a heap of that many bytes and an
+allocation that does not fit raises MemoryError, as on the console: e.g. a
+framebuffer swap that would hold both buffers at once fails here too.
+
+    python tools/hostsim.py --frames 5000              # every AI game
+    python tools/hostsim.py --game Snake --frames 20000 --seed 7
+    python tools/hostsim.py --heap 190000              # RP2040-sized heap
+"""
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+import types
+import weakref
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "main.py")
+HEAP = 180000  # what the fake gc reports as free without --heap
+
+
+class Clock:
+    """MicroPython's time module on a virtual clock: only sleeps advance it."""
+
+    def __init__(self):
+        self.us = 0
+
+    def module(self):
+        t = types.ModuleType("time")
+        t.sleep = lambda s: self.advance(int(s * 1000000))
+        t.sleep_ms = lambda ms: self.advance(int(ms) * 1000)
+        t.sleep_us = lambda us: self.advance(int(us))
+        t.ticks_ms = lambda: self.us // 1000
+        t.ticks_us = lambda: self.us
+        t.ticks_diff = lambda a, b: a - b
+        t.ticks_add = lambda a, b: a + b
+        return t
+
+    def advance(self, us):
+        if us > 0:
+            self.us += us
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 2
+
+    def __init__(self, *args, **kwargs):
+        self.v = 1  # buttons are pulled up: released
+
+    def value(self, v=None):
+        if v is None:
+            return self.v
+        self.v = v
+
+
+class ADC:
+    def __init__(self, *args):
+        pass
+
+    def read_u16(self):
+        return 32768  # joystick centred
+
+
+class Device:
+    """SPI, PWM and UART: accepts every call and does nothing."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FrameBuffer(Device):
+    pass
+
+
+class Bytes(bytearray):
+    """A bytearray that can be watched with weakref, to see it freed."""
+
+
+class Heap:
+    """A capped heap for main.py's bytearrays: each one counts against
+    `size` until it is garbage, and one that does not fit raises
+    MemoryError. Fragmentation is not modelled."""
+
+    def __init__(self, size):
+        self.size = size
+        self.used = 0
+        self.peak = 0
+
+    def bytearray(self, *args):
+        b = Bytes(*args)
+        n = len(b)
+        if self.used + n > self.size:
+            raise MemoryError("memory allocation failed, allocating %d bytes" % n)
+        self.used += n
+        self.peak = max(self.peak, self.used)
+        weakref.finalize(b, self.free, n)
+        return b
+
+    def free(self, n):
+        self.used -= n
+
+
+def rle_row(out, src, i, end):
+    """main.rle_row() without viper's ptr8: same runs, same return value."""
+    k = 3
+    runs = 0
+    while i < end:
+        hi = src[i]
+        lo = src[i + 1]
+        j = i + 2
+        while j < end and src[j] == hi and src[j + 1] == lo:
+            j += 2
+        out[k] = (j - i) >> 1
+        out[k + 1] = hi
+        out[k + 2] = lo
+        k += 3
+        runs += 1
+        i = j
+    out[2] = runs
+    return k
+
+
+def fake_modules(clock, heap=None):
+    machine = types.ModuleType("machine")
+    machine.Pin = Pin
+    machine.ADC = ADC
+    machine.SPI = machine.PWM = machine.UART = Device
+
+    framebuf = types.ModuleType("framebuf")
+    framebuf.FrameBuffer = FrameBuffer
+    framebuf.RGB565 = 1
+
+    micropython = types.ModuleType("micropython")
+    micropython.viper = micropython.native = lambda f: f
+    micropython.const = lambda x: x
+
+    gc = types.ModuleType("gc")
+    gc.collect = lambda: None
+    if heap:
+        gc.mem_free = lambda: heap.size - heap.used
+        gc.mem_alloc = lambda: heap.used
+    else:
+        gc.mem_free = lambda: HEAP
+        gc.mem_alloc = lambda: 0
+
+    return {"time": clock.module(), "machine": machine, "framebuf": framebuf,
+            "micropython": micropython, "gc": gc}
+
+
+def load(path=MAIN, heap=None):
+    """Import main.py against the fakes and boot it; returns the module.
+    With `heap` (bytes), its bytearrays come out of a Heap of that size."""
+    clock = Clock()
+    heap = Heap(heap) if heap else None
+    fakes = fake_modules(clock, heap)
+    real = {name: sys.modules.get(name) for name in fakes}
+    sys.modules.update(fakes)
+    try:
+        spec = importlib.util.spec_from_file_location("arcade", path)
+        m = importlib.util.module_from_spec(spec)
+        if heap:
+            m.bytearray = heap.bytearray
+        spec.loader.exec_module(m)
+    finally:
+        for name, mod in real.items():
+            if mod is None:
+                del sys.modules[name]
+            else:
+                sys.modules[name] = mod
+    m.clock = clock
+    m.heap = heap
+    m.STREAM = False  # nothing on stdin to ask for frames
+    m.double_row = lambda dst, src, off, n: None  # no panel to scan out to
+    m.rle_row = rle_row
+    m.boot()
+    return m
+
+
+def session(m, sel, frames):
+    """One life of GAMES[sel] played by its AI, handed back after `frames`
+    frames if it lasts that long. Returns (frames it lasted, game over)."""
+    count = [0]
+    over = []
+    show_game_over = m.show_game_over
+
+    def hook():
+        count[0] += 1
+        if count[0] >= frames and m.autoplay_end is None:
+            m.autoplay_end = m.time.ticks_ms()  # btn_a() hands back now
+
+    def game_over(title, score):
+        over.append(count[0])  # the game over screen is not a game frame
+        show_game_over(title, score)
+
+    m.display.hooks.append(hook)
+    m.show_game_over = game_over
+    m.autoplay = True
+    m.autoplay_end = None
+    try:
+        m.launch(sel)
+    finally:
+        m.autoplay = False
+        m.show_game_over = show_game_over
+        m.display.hooks.remove(hook)
+    if over:
+        return over[0], True
+    return count[0], False
+
+
+def play(m, sel, frames):
+    """Let the AI play GAMES[sel] for `frames` frames, starting over after
+    every game over. Returns the frames each life lasted."""
+    lives = []
+    while sum(lives) < frames:
+        lives.append(session(m, sel, frames - sum(lives))[0])
+    return lives
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--game", action="append", help="game name (repeatable, default: all with an AI)")
+    ap.add_argument("--frames", type=int, default=3000, help="frames to play per game")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--heap", type=int, help="cap main.py's bytearrays at this many bytes")
+    args = ap.parse_args()
+
+    m = load(heap=args.heap)
+    if args.game:
+        names = [g.lower() for g in m.GAMES]
+        try:
+            sels = [names.index(g.lower()) for g in args.game]
+        except ValueError:
+            sys.exit("games with an AI: %s" % ", ".join(m.GAMES[i] for i in m.DEMO_GAMES))
+    else:
+        sels = m.DEMO_GAMES
+
+    for sel in sels:
+        if sel not in m.DEMO_GAMES:
+            sys.exit("%s has no AI player" % m.GAMES[sel])
+        random.seed(args.seed)
+        t0 = time.perf_counter()
+        v0 = m.clock.us
+        scales = set()
+        hook = lambda: scales.add(m.display.scale)
+        m.display.hooks.append(hook)
+        lives = play(m, sel, args.frames)
+        m.display.hooks.remove(hook)
+        print("[soak] %s frames=%d lives=%d longest=%d virtual_s=%.1f host_s=%.2f" % (
+            m.GAMES[sel], sum(lives), len(lives), max(lives),
+            (m.clock.us - v0) / 1e6, time.perf_counter() - t0))
+        if scales != {m.GAME_SCALE[sel]}:
+            sys.exit("%s ran at scale %s, not %d" % (
+                m.GAMES[sel], "/".join(map(str, sorted(scales))), m.GAME_SCALE[sel]))
+
+
+if __name__ == "__main__":
+    main()
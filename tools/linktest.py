@@ -0,0 +1,182 @@
+"""Run the link-play protocol (link.py) between two peers on a PC.
+
+The two peers talk over a socket pair (default) or a pty pair, standing in
+for the UART cable. Each peer runs the same lockstep loop as
+game_pong_link(), with random inputs and a state that folds in both
+players' inputs. The test passes when both peers see identical input
+streams and no checksum mismatch.
+
+    python tools/linktest.py --frames 2000
+    python tools/linktest.py --pty --noise 0.01
+    python tools/linktest.py --desync-at 500     # checksum must catch it
+"""
+import argparse
+import os
+import random
+import select
+import socket
+import sys
+import threading
+import time
+import tty
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import link  # noqa: E402
+
+
+class FdPort:
+    """machine.UART-like wrapper around a file descriptor."""
+
+    def __init__(self, fd, noise=0.0, seed=0):
+        self.fd = fd
+        self.noise = noise
+        self.rng = random.Random(seed)
+        os.set_blocking(fd, False)
+
+    def write(self, buf):
+        data = bytes(buf)
+        if self.noise:
+            out = bytearray()
+            for b in data:
+                r = self.rng.random()
+                if r < self.noise / 2:
+                    continue                      # byte lost
+                if r < self.noise:
+                    b ^= 1 << self.rng.randrange(8)  # bit flipped
+                out.append(b)
+            data = bytes(out)
+        while data:
+            try:
+                n = os.write(self.fd, data)
+                data = data[n:]
+            except BlockingIOError:
+                select.select([], [self.fd], [], 0.01)
+
+    def any(self):
+        return 1 if select.select([self.fd], [], [], 0)[0] else 0
+
+    def read(self, n):
+        try:
+            return os.read(self.fd, n) or None
+        except BlockingIOError:
+            return None
+
+
+def peer(port, frames, seed, desync_at, out, timeout=3.0):
+    rng = random.Random(seed)
+    lk = link.Link(port)
+    deadline = time.monotonic() + timeout
+    while not lk.connected():
+        lk.hello()
+        for _ in range(20):
+            lk.poll()
+            time.sleep(0.001)
+        if time.monotonic() > deadline:
+            out["result"] = "no handshake"
+            return
+
+    state = 0
+    seen = []
+    frame = 0
+    out["result"] = "ok"
+    t0 = time.monotonic()
+    while frame < frames:
+        lk.send_input(frame + lk.delay, rng.randrange(4))
+        start = last = time.monotonic()
+        theirs = lk.remote_input(frame)
+        while theirs < 0:
+            now = time.monotonic()
+            if now - start > timeout:
+                out["result"] = "link lost at frame %d" % frame
+                break
+            if now - last > 0.02:
+                last = now
+                lk.resend()
+            time.sleep(0.0002)
+            lk.poll()
+            theirs = lk.remote_input(frame)
+        if theirs < 0:
+            break
+        mine = lk.local_input(frame)
+        lk.consume(frame)
+        in0, in1 = (mine, theirs) if lk.player == 0 else (theirs, mine)
+        seen.append((in0, in1))
+
+        state = zlib.crc32(bytes((in0, in1)), state)
+        if frame == desync_at and lk.player == 1:
+            state ^= 1
+        frame += 1
+        if frame % lk.check_every == 0:
+            lk.check(frame, state)
+        lk.poll()
+        if lk.error:
+            out["result"] = "%s at frame %d" % (lk.error, frame)
+            break
+
+    # Let the last CHECK packets arrive before comparing
+    end = time.monotonic() + 0.05
+    while time.monotonic() < end and not lk.error:
+        lk.poll()
+        time.sleep(0.001)
+    if lk.error and out["result"] == "ok":
+        out["result"] = lk.error
+
+    out.update(player=lk.player, frames=frame, seen=seen, sent=lk.sent,
+               bad=lk.bad, secs=time.monotonic() - t0)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=1000)
+    ap.add_argument("--pty", action="store_true", help="use a pty pair instead of a socket pair")
+    ap.add_argument("--noise", type=float, default=0.0, help="per-byte drop/corrupt probability")
+    ap.add_argument("--desync-at", type=int, default=-1, help="corrupt P1's state at this frame")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    if args.pty:
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        fds = (master, slave)
+    else:
+        a, b = socket.socketpair()
+        fds = (a.detach(), b.detach())
+
+    outs = [{}, {}]
+    threads = [
+        threading.Thread(target=peer, args=(
+            FdPort(fds[i], args.noise, args.seed + i), args.frames,
+            args.seed * 10 + i, args.desync_at, outs[i]))
+        for i in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for o in outs:
+        if "frames" not in o:
+            print("P?: %s" % o["result"])
+            continue
+        print("P%d: %s, %d frames in %.2fs, %.1f bytes/frame, %d bad packets" % (
+            o["player"], o["result"], o["frames"], o["secs"],
+            o["sent"] / max(1, o["frames"]), o["bad"]))
+
+    ok = all(o.get("result") == "ok" for o in outs)
+    if ok:
+        if outs[0]["seen"] != outs[1]["seen"]:
+            print("FAIL: peers simulated different input streams")
+            ok = False
+        elif outs[0]["player"] == outs[1]["player"]:
+            print("FAIL: both peers picked the same side")
+            ok = False
+    if args.desync_at >= 0:
+        ok = any("desync" in o.get("result", "") for o in outs)
+        print("desync %s" % ("detected" if ok else "NOT detected"))
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()